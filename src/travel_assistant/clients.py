@@ -1,17 +1,24 @@
 """API client wrappers for the Travel Assistant MCP server."""
 
-import json
-from datetime import datetime
 from typing import Any, Dict, Optional
+from urllib.error import URLError
+from urllib.request import Request as HTTPRequest
 
 import requests
 from amadeus import Client as AmadeusClient  # type: ignore
 from amadeus import ResponseError  # type: ignore
+from urllib3.util.retry import Retry
 
 from .helpers import (
+    TRANSIENT_HTTP_STATUSES,
+    create_pooled_session,
+    dumps_json,
     get_exchange_rate_api_key,
+    get_exchange_rate_session,
     get_geolocator,
     get_serpapi_key,
+    loads_json,
+    now_iso,
 )
 
 # =====================================================================
@@ -22,12 +29,26 @@ from .helpers import (
 class SerpAPIClient:
     """Client for Google Flights, Hotels, Events, and Finance via SerpAPI."""
 
+    __slots__ = ("base_url", "api_key", "session")
+
     def __init__(self) -> None:
         self.base_url = "https://serpapi.com/search"
         try:
             self.api_key: Optional[str] = get_serpapi_key()
         except ValueError:
             self.api_key = None
+        # Keep-alive pool so repeated searches skip the TCP/TLS handshake;
+        # throttling and transient upstream errors are retried with backoff
+        self.session = create_pooled_session(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=tuple(TRANSIENT_HTTP_STATUSES),
+                allowed_methods=frozenset({"GET"}),
+            ),
+        )
 
     def _request(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Make a request to SerpAPI."""
@@ -35,16 +56,29 @@ class SerpAPIClient:
             return {"error": "SERPAPI_KEY environment variable not set"}
         params["api_key"] = self.api_key
         try:
-            response = requests.get(self.base_url, params=params, timeout=10)
+            response = self.session.get(self.base_url, params=params, timeout=10)
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            # Decode straight from bytes (orjson when installed); payloads run large
+            return loads_json(response.content)
+        except (requests.exceptions.RequestException, ValueError) as e:
             return {"error": f"SerpAPI request failed: {str(e)}"}
 
-    def search_flights(self, **params) -> dict[str, Any]:
-        """Search for flights using Google Flights."""
+    def search_flights(
+        self, max_results: Optional[int] = None, **params
+    ) -> dict[str, Any]:
+        """Search for flights using Google Flights.
+
+        When ``max_results`` is given, ``best_flights`` and ``other_flights`` are
+        trimmed as soon as the response is parsed so the untrimmed lists are
+        released before any downstream processing.
+        """
         params["engine"] = "google_flights"
-        return self._request(params)
+        data = self._request(params)
+        if max_results is not None:
+            for key in ("best_flights", "other_flights"):
+                if key in data:
+                    data[key] = data[key][:max_results]
+        return data
 
     def search_hotels(self, **params) -> dict[str, Any]:
         """Search for hotels using Google Hotels."""
@@ -62,6 +96,55 @@ class SerpAPIClient:
 # =====================================================================
 
 
+class _SessionHTTPResponse:
+    """urllib-style view of a ``requests.Response`` for the Amadeus SDK parser."""
+
+    __slots__ = ("status", "_response")
+
+    def __init__(self, response: requests.Response) -> None:
+        self.status = response.status_code
+        self._response = response
+
+    def info(self) -> Any:
+        """Return the (case-insensitive) response headers."""
+        return self._response.headers
+
+    def read(self) -> bytes:
+        """Return the raw response body."""
+        return self._response.content
+
+
+class AmadeusSessionHTTP:
+    """HTTP handler for ``amadeus.Client(http=...)`` backed by a pooled Session.
+
+    The SDK defaults to ``urllib.request.urlopen``, which opens a new TCP/TLS
+    connection for every call, including OAuth token requests. This handler
+    sends the SDK's prepared requests through a keep-alive Session instead.
+    """
+
+    __slots__ = ("session", "timeout")
+
+    def __init__(
+        self, session: Optional[requests.Session] = None, timeout: float = 15
+    ) -> None:
+        self.session = session or create_pooled_session(pool_maxsize=32)
+        self.timeout = timeout
+
+    def __call__(self, request: HTTPRequest) -> _SessionHTTPResponse:
+        try:
+            response = self.session.request(
+                request.get_method(),
+                request.full_url,
+                data=request.data,
+                headers=dict(request.header_items()),
+                timeout=self.timeout,
+            )
+        except requests.exceptions.RequestException as e:
+            # The SDK turns URLError into its own NetworkError
+            raise URLError(e) from e
+        return _SessionHTTPResponse(response)
+
+
 class AmadeusClientWrapper:
     """Wrapper around Amadeus SDK client."""
 
@@ -78,23 +161,23 @@ class AmadeusClientWrapper:
             infants = params.get("infants", 0) or 0
 
             if not (1 <= adults <= 9):
-                return json.dumps({"error": "Adults must be between 1 and 9"})
+                return dumps_json({"error": "Adults must be between 1 and 9"})
 
             if children and infants and (adults + children > 9):
-                return json.dumps({"error": "Total seated travelers cannot exceed 9"})
+                return dumps_json({"error": "Total seated travelers cannot exceed 9"})
 
             if infants and (infants > adults):
-                return json.dumps({"error": "Infants cannot exceed adults"})
+                return dumps_json({"error": "Infants cannot exceed adults"})
 
             response = self.client.shopping.flight_offers_search.get(**params)
             result = response.body
             result["provider"] = "Amadeus GDS"
-            result["search_timestamp"] = datetime.now().isoformat()
-            return json.dumps(result)
+            result["search_timestamp"] = now_iso()
+            return dumps_json(result)
         except ResponseError as e:
-            return json.dumps({"error": f"Amadeus API error: {str(e)}"})
+            return dumps_json({"error": f"Amadeus API error: {str(e)}"})
         except Exception as e:
-            return json.dumps({"error": f"Unexpected error: {str(e)}"})
+            return dumps_json({"error": f"Unexpected error: {str(e)}"})
 
     def search_hotels_by_city(self, **params) -> str:
         """Search for hotels by city using Amadeus."""
@@ -102,12 +185,12 @@ class AmadeusClientWrapper:
             response = self.client.reference_data.locations.hotels.by_city.get(**params)
             result = response.body
             result["provider"] = "Amadeus GDS"
-            result["search_timestamp"] = datetime.now().isoformat()
-            return json.dumps(result)
+            result["search_timestamp"] = now_iso()
+            return dumps_json(result)
         except ResponseError as e:
-            return json.dumps({"error": f"Amadeus API error: {str(e)}"})
+            return dumps_json({"error": f"Amadeus API error: {str(e)}"})
         except Exception as e:
-            return json.dumps({"error": f"Unexpected error: {str(e)}"})
+            return dumps_json({"error": f"Unexpected error: {str(e)}"})
 
     def search_hotels_by_geocode(self, **params) -> str:
         """Search for hotels by coordinates using Amadeus."""
@@ -117,28 +200,28 @@ class AmadeusClientWrapper:
             )
             result = response.body
             result["provider"] = "Amadeus GDS"
-            result["search_timestamp"] = datetime.now().isoformat()
-            return json.dumps(result)
+            result["search_timestamp"] = now_iso()
+            return dumps_json(result)
         except ResponseError as e:
-            return json.dumps({"error": f"Amadeus API error: {str(e)}"})
+            return dumps_json({"error": f"Amadeus API error: {str(e)}"})
         except Exception as e:
-            return json.dumps({"error": f"Unexpected error: {str(e)}"})
+            return dumps_json({"error": f"Unexpected error: {str(e)}"})
 
     def search_hotel_offers(self, **params) -> str:
         """Search for hotel offers (real-time availability) using Amadeus."""
         if not params.get("cityCode") and not params.get("hotelIds"):
-            return json.dumps({"error": "Either cityCode or hotelIds must be provided"})
+            return dumps_json({"error": "Either cityCode or hotelIds must be provided"})
 
         try:
             response = self.client.shopping.hotel_offers.get(**params)
             result = response.body
             result["provider"] = "Amadeus GDS"
-            result["search_timestamp"] = datetime.now().isoformat()
-            return json.dumps(result)
+            result["search_timestamp"] = now_iso()
+            return dumps_json(result)
         except ResponseError as e:
-            return json.dumps({"error": f"Amadeus API error: {str(e)}"})
+            return dumps_json({"error": f"Amadeus API error: {str(e)}"})
         except Exception as e:
-            return json.dumps({"error": f"Unexpected error: {str(e)}"})
+            return dumps_json({"error": f"Unexpected error: {str(e)}"})
 
     def search_activities(self, **params) -> str:
         """Search for activities/tours using Amadeus."""
@@ -146,19 +229,19 @@ class AmadeusClientWrapper:
             response = self.client.shopping.activities.get(**params)
             result = response.body
             result["provider"] = "Amadeus GDS"
-            result["search_timestamp"] = datetime.now().isoformat()
-            return json.dumps(result)
+            result["search_timestamp"] = now_iso()
+            return dumps_json(result)
         except ResponseError as e:
-            return json.dumps({"error": f"Amadeus API error: {str(e)}"})
+            return dumps_json({"error": f"Amadeus API error: {str(e)}"})
         except AttributeError as e:
-            return json.dumps(
+            return dumps_json(
                 {
                     "error": f"Tours and Activities API not available: {str(e)}",
                     "note": "This API might require a newer SDK version or special access",
                 }
             )
         except Exception as e:
-            return json.dumps({"error": f"Unexpected error: {str(e)}"})
+            return dumps_json({"error": f"Unexpected error: {str(e)}"})
 
     def get_activity_details(self, activity_id: str) -> str:
         """Get details for a specific activity using Amadeus."""
@@ -166,19 +249,19 @@ class AmadeusClientWrapper:
             response = self.client.shopping.activity(activity_id).get()
             result = response.body
             result["provider"] = "Amadeus GDS"
-            result["search_timestamp"] = datetime.now().isoformat()
-            return json.dumps(result)
+            result["search_timestamp"] = now_iso()
+            return dumps_json(result)
         except ResponseError as e:
-            return json.dumps({"error": f"Amadeus API error: {str(e)}"})
+            return dumps_json({"error": f"Amadeus API error: {str(e)}"})
         except AttributeError as e:
-            return json.dumps(
+            return dumps_json(
                 {
                     "error": f"Tours and Activities API not available: {str(e)}",
                     "note": "This API might require a newer SDK version or special access",
                 }
             )
         except Exception as e:
-            return json.dumps({"error": f"Unexpected error: {str(e)}"})
+            return dumps_json({"error": f"Unexpected error: {str(e)}"})
 
 
 # =====================================================================
@@ -204,9 +287,9 @@ class ExchangeRateClient:
             return {"error": "EXCHANGE_RATE_API_KEY environment variable not set"}
         url = f"{self.base_url}/{self.api_key}/pair/{from_currency.upper()}/{to_currency.upper()}"
         try:
-            response = requests.get(url, timeout=10)
+            response = get_exchange_rate_session().get(url, timeout=10)
             response.raise_for_status()
-            data = response.json()
+            data = loads_json(response.content)
 
             if data.get("result") != "success":
                 return {"error": data.get("error-type") or "ExchangeRate-API error"}
@@ -223,10 +306,10 @@ class ExchangeRateClient:
                 "amount": amount,
                 "exchange_rate": rate,
                 "converted_amount": converted,
-                "search_timestamp": datetime.now().isoformat(),
+                "search_timestamp": now_iso(),
                 "provider": "exchangerate-api",
             }
-        except requests.exceptions.RequestException:
+        except (requests.exceptions.RequestException, ValueError):
             # SECURITY: Never expose the URL which contains the API key
             return {
                 "error": "Currency API request failed. Please check currency codes and try again."
@@ -282,7 +365,7 @@ class GeocodingClient:
                     "latitude": float(result.latitude),
                     "longitude": float(result.longitude),
                     "address": result.address,
-                    "search_timestamp": datetime.now().isoformat(),
+                    "search_timestamp": now_iso(),
                 }
             else:
                 return {
@@ -295,7 +378,7 @@ class GeocodingClient:
                         }
                         for r in result
                     ],
-                    "search_timestamp": datetime.now().isoformat(),
+                    "search_timestamp": now_iso(),
                 }
         except Exception as e:
             return {"error": f"Geocoding error: {str(e)}"}
@@ -320,7 +403,7 @@ class GeocodingClient:
                 "latitude": latitude,
                 "longitude": longitude,
                 "address": result.address,
-                "search_timestamp": datetime.now().isoformat(),
+                "search_timestamp": now_iso(),
             }
         except Exception as e:
             return {"error": f"Reverse geocoding error: {str(e)}"}
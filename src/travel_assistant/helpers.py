@@ -1,14 +1,35 @@
 """Utility functions for the Travel Assistant MCP server."""
 
+import functools
+import hashlib
+import json
+import math
+import operator
 import os
+import random
 import re
+import sqlite3
+import threading
+import time
 import uuid
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable
+from concurrent.futures import Future
 from datetime import datetime
 from typing import Any, Tuple
 
 import requests
+from geopy.adapters import RequestsAdapter  # type: ignore
 from geopy.extra.rate_limiter import RateLimiter  # type: ignore
 from geopy.geocoders import Nominatim  # type: ignore
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 # Re-export accessibility functions
 from mcp_accessibility_models import (  # noqa: F401
@@ -26,7 +47,13 @@ def _get_or_create_geolocator():
     global _GEOLOCATOR_INSTANCE
     if _GEOLOCATOR_INSTANCE is None:
         email_identifier = f"{uuid.uuid4()}.com"
-        geolocator = Nominatim(user_agent=email_identifier)
+        # Explicit pooled adapter so every lookup reuses the same TLS connection
+        geolocator = Nominatim(
+            user_agent=email_identifier,
+            adapter_factory=functools.partial(
+                RequestsAdapter, pool_connections=4, pool_maxsize=16
+            ),
+        )
         _GEOLOCATOR_INSTANCE = (
             RateLimiter(geolocator.geocode, min_delay_seconds=1),
             RateLimiter(geolocator.reverse, min_delay_seconds=1),
@@ -34,6 +61,57 @@ def _get_or_create_geolocator():
     return _GEOLOCATOR_INSTANCE
 
 
+# Module-level persistent geocode cache (initialized once, reused across requests)
+_GEOCODE_CACHE_INSTANCE: "PersistentCache | None" = None
+_GEOCODE_CACHE_INITIALIZED = False
+_DEFAULT_GEOCODE_CACHE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "travel_assistant", "geocode.sqlite3"
+)
+
+
+def get_geocode_cache() -> "PersistentCache | None":
+    """Get the on-disk geocode cache, or None if disabled or unavailable.
+
+    The location is read from ``GEOCODE_CACHE_PATH``; set it to an empty
+    string to disable persistent geocode caching.
+    """
+    global _GEOCODE_CACHE_INSTANCE, _GEOCODE_CACHE_INITIALIZED
+    if not _GEOCODE_CACHE_INITIALIZED:
+        _GEOCODE_CACHE_INITIALIZED = True
+        path = os.getenv("GEOCODE_CACHE_PATH", _DEFAULT_GEOCODE_CACHE_PATH)
+        if path:
+            try:
+                _GEOCODE_CACHE_INSTANCE = PersistentCache(path)
+            except (OSError, sqlite3.Error):
+                _GEOCODE_CACHE_INSTANCE = None
+    return _GEOCODE_CACHE_INSTANCE
+
+
+# Punctuation Nominatim treats as a separator ("Bern, CH" == "Bern CH")
+_GEOCODE_SEPARATORS = re.compile(r"[,.;:]+")
+
+
+def make_geocode_cache_key(
+    location: str,
+    language: str,
+    country_codes: str | None,
+    exactly_one: bool,
+    addressdetails: bool,
+) -> str:
+    """Build a compact, normalized cache key for a geocoding query.
+
+    Case, separator punctuation, surrounding/repeated whitespace and
+    country-code order do not affect the key, so equivalent queries share a
+    cache entry.
+    """
+    location = " ".join(_GEOCODE_SEPARATORS.sub(" ", location.casefold()).split())
+    if country_codes:
+        codes = (code.strip().lower() for code in country_codes.split(","))
+        country_codes = ",".join(sorted(code for code in codes if code))
+    raw = f"{location}|{language.lower()}|{country_codes}|{exactly_one}|{addressdetails}"
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
 def get_serpapi_key() -> str:
     """Get SerpAPI key from environment variable."""
     api_key = os.getenv("SERPAPI_KEY")
@@ -55,6 +133,54 @@ def get_geolocator() -> Tuple[Any, Any]:
     return _get_or_create_geolocator()
 
 
+def create_pooled_session(
+    pool_connections: int = 10, pool_maxsize: int = 10, max_retries: Any = 0
+) -> requests.Session:
+    """Create a requests Session with a keep-alive connection pool.
+
+    Args:
+        pool_connections: Number of per-host connection pools to cache
+        pool_maxsize: Maximum number of connections kept alive per host
+        max_retries: Retry count or urllib3 ``Retry`` policy for the adapter
+
+    Returns:
+        A Session that reuses TCP/TLS connections across requests and accepts
+        every response compression the environment can decode
+    """
+    session = requests.Session()
+    # Advertise every codec urllib3 can decode here (adds br/zstd when installed)
+    session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=max_retries,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Module-level ExchangeRate-API session (initialized once, reused across requests)
+_EXCHANGE_RATE_SESSION = None
+
+
+def get_exchange_rate_session() -> requests.Session:
+    """Get the shared keep-alive Session for ExchangeRate-API (lazy initialization)."""
+    global _EXCHANGE_RATE_SESSION
+    if _EXCHANGE_RATE_SESSION is None:
+        _EXCHANGE_RATE_SESSION = create_pooled_session(
+            pool_connections=4,
+            pool_maxsize=20,
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.2,
+                status_forcelist=tuple(TRANSIENT_HTTP_STATUSES),
+                allowed_methods=frozenset({"GET"}),
+            ),
+        )
+    return _EXCHANGE_RATE_SESSION
+
+
 def sanitize_url_for_logging(url: str) -> str:
     """Sanitize URLs by replacing API keys with [REDACTED].
 
@@ -77,6 +203,26 @@ def sanitize_url_for_logging(url: str) -> str:
     return url
 
 
+# (second, ISO string) of the last rendered timestamp; swapped as one tuple so
+# concurrent readers never see a mismatched pair
+_NOW_ISO_CACHE: tuple[int, str] = (0, "")
+
+
+def now_iso() -> str:
+    """Return the current local time as an ISO 8601 string, at 1s resolution.
+
+    Response timestamps are informational, so the rendered string is reused
+    for every call within the same wall-clock second.
+    """
+    global _NOW_ISO_CACHE
+    second = int(time.time())
+    cached_second, cached = _NOW_ISO_CACHE
+    if second != cached_second:
+        cached = datetime.fromtimestamp(second).isoformat()
+        _NOW_ISO_CACHE = (second, cached)
+    return cached
+
+
 def format_amadeus_response(response_body: dict[str, Any]) -> dict[str, Any]:
     """Format Amadeus API response with metadata.
 
@@ -86,10 +232,381 @@ def format_amadeus_response(response_body: dict[str, Any]) -> dict[str, Any]:
     Returns:
         Formatted response dict with provider and timestamp
     """
-    result = response_body.copy() if isinstance(response_body, dict) else response_body
-    result["provider"] = "Amadeus GDS"
-    result["search_timestamp"] = datetime.now().isoformat()
-    return result
+    return {**response_body, "provider": "Amadeus GDS", "search_timestamp": now_iso()}
+
+
+def dumps_json(obj: Any) -> str:
+    """Serialize ``obj`` to a JSON string, using orjson when it is installed.
+
+    Values that are not natively JSON-serializable are rendered with ``str``.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, default=str)
+
+
+def loads_json(data: str | bytes) -> Any:
+    """Parse a JSON document, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class LazyJSON:
+    """Defer JSON serialization of an object until it is rendered as a string.
+
+    Pass instances as %-style logging arguments so the payload is only
+    serialized when the log record is actually emitted.
+    """
+
+    __slots__ = ("obj",)
+
+    def __init__(self, obj: Any) -> None:
+        self.obj = obj
+
+    def __str__(self) -> str:
+        return dumps_json(self.obj)
+
+
+# SerpAPI carbon_emissions fields, fetched together in one C-level call
+_EMISSIONS_FIELDS = ("this_flight", "typical_for_this_route", "difference_percent")
+_get_emissions_fields = operator.itemgetter(*_EMISSIONS_FIELDS)
+_EMISSIONS_NOTE = (
+    "Negative difference % indicates lower emissions than typical for this route"
+)
+
+
+def extract_flight_emissions(flights: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Normalize Google Flights carbon emissions data for a list of flights.
+
+    Args:
+        flights: Flight dicts as returned by SerpAPI
+
+    Returns:
+        The flights with ``carbon_emissions`` reshaped into gram-suffixed fields
+        plus an explanatory note. Flights carrying emissions are shallow copies
+        (inputs may be shared through a cache); others are passed through.
+    """
+    processed_flights = []
+    for flight in flights:
+        emissions = flight.get("carbon_emissions")
+        if emissions is None:
+            processed_flights.append(flight)
+            continue
+        try:
+            this_flight, typical, difference = _get_emissions_fields(emissions)
+        except KeyError:
+            this_flight, typical, difference = (
+                emissions.get(field) for field in _EMISSIONS_FIELDS
+            )
+        processed_flights.append(
+            {
+                **flight,
+                "carbon_emissions": {
+                    "this_flight_grams": this_flight,
+                    "typical_for_route_grams": typical,
+                    "difference_percent": difference,
+                    "note": _EMISSIONS_NOTE,
+                },
+            }
+        )
+    return processed_flights
+
+
+def summarize_co2_emissions(
+    emissions: list[dict[str, Any]], inv_adults: float
+) -> dict[str, Any]:
+    """Build a per-cabin CO2 summary for an Amadeus flight offer.
+
+    Args:
+        emissions: The offer's ``co2Emissions`` entries
+        inv_adults: Reciprocal of the adult passenger count
+
+    Returns:
+        Summary with per-cabin weights, per-passenger share and total weight
+    """
+    emissions_by_cabin = []
+    total_weight = 0
+    for emission in emissions:
+        weight = emission.get("weight", 0)
+        total_weight += weight
+        emissions_by_cabin.append(
+            {
+                "cabin": emission.get("cabin", "UNKNOWN"),
+                "weight_kg": emission.get("weight"),
+                "per_passenger_kg": round(weight * inv_adults, 2),
+            }
+        )
+    return {
+        "emissions_by_cabin": emissions_by_cabin,
+        "total_weight_kg": total_weight,
+        "unit": "kilograms",
+    }
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire ``ttl`` seconds after being set.
+
+    Used to short-circuit repeated upstream API calls for identical searches.
+    ``set`` accepts a per-entry ``ttl`` overriding the cache default.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300.0) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(
+        self, key: Hashable, default: Any = None, max_age: float | None = None
+    ) -> Any:
+        """Return the cached value for ``key``, or ``default`` if missing or expired.
+
+        ``max_age`` lets a caller demand fresher data than the cache TTL; an
+        entry older than ``max_age`` but within the TTL is kept for others.
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            stored_at, ttl, value = entry
+            age = time.monotonic() - stored_at
+            if age >= ttl:
+                del self._data[key]
+                return default
+            if max_age is not None and age >= max_age:
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        """Store ``value`` under ``key``, evicting the least recently used entry if full."""
+        with self._lock:
+            self._data[key] = (
+                time.monotonic(),
+                self.ttl if ttl is None else ttl,
+                value,
+            )
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class PersistentCache:
+    """SQLite-backed JSON cache with per-entry expiry that survives restarts.
+
+    A single connection is shared across threads behind a lock.
+    """
+
+    def __init__(self, path: str) -> None:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "DELETE FROM cache WHERE expires_at <= ?", (time.time(),)
+            )
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the cached value for ``key``, or ``default`` if missing or expired."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None or row[1] <= time.time():
+            return default
+        return json.loads(row[0])
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """Store a JSON-serializable ``value`` under ``key`` for ``ttl`` seconds."""
+        payload = json.dumps(value, default=str)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, payload, time.time() + ttl),
+            )
+
+
+# Mean Earth radius (IUGG) and unit conversions used for distance calculations
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_MILE = 1.609344
+KM_PER_NAUTICAL_MILE = 1.852
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance in kilometers on a spherical Earth.
+
+    Within about 0.5% of the ellipsoidal geodesic, which is plenty for
+    itinerary planning and far cheaper to compute.
+    """
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lon2 - lon1)
+    a = (
+        math.sin(d_phi / 2) ** 2
+        + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+def haversine_matrix_km(points: list[tuple[float, float]]) -> list[list[float]]:
+    """Pairwise haversine distances in kilometers for a list of (lat, lon) points.
+
+    Radians and latitude cosines are computed once per point and only the
+    upper triangle is evaluated, mirroring it into the lower one.
+    """
+    radians = [(math.radians(lat), math.radians(lon)) for lat, lon in points]
+    cosines = [math.cos(phi) for phi, _ in radians]
+    size = len(points)
+    matrix = [[0.0] * size for _ in range(size)]
+    for i in range(size):
+        phi1, lambda1 = radians[i]
+        for j in range(i + 1, size):
+            phi2, lambda2 = radians[j]
+            a = (
+                math.sin((phi2 - phi1) / 2) ** 2
+                + cosines[i] * cosines[j] * math.sin((lambda2 - lambda1) / 2) ** 2
+            )
+            matrix[i][j] = matrix[j][i] = (
+                2 * EARTH_RADIUS_KM * math.asin(math.sqrt(min(a, 1.0)))
+            )
+    return matrix
+
+
+def make_params_cache_key(params: dict[str, Any]) -> Hashable:
+    """Build a cache key for a dict of API parameters.
+
+    Primitive values (and lists of them) key on a sorted item tuple with no
+    serialization; anything unhashable falls back to a digest of its JSON.
+    Every value carries its type, since 1, 1.0 and True compare and hash equal
+    but are sent upstream as different strings.
+    """
+    key = tuple(
+        sorted(
+            (
+                name,
+                type(value),
+                (
+                    tuple((type(item), item) for item in value)
+                    if isinstance(value, list)
+                    else value
+                ),
+            )
+            for name, value in params.items()
+        )
+    )
+    try:
+        hash(key)
+    except TypeError:
+        return hashlib.blake2b(
+            json.dumps(params, sort_keys=True, default=str).encode(),
+            digest_size=16,
+        ).hexdigest()
+    return key
+
+
+def ttl_cached(
+    ttl: float = 180, maxsize: int = 2048
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Cache an API call ``fn(params, *args)`` on a hash of ``params`` for ``ttl`` seconds.
+
+    Extra positional arguments (e.g. a shared SDK client) are not part of the
+    key. The wrapped function accepts ``force_refresh=True`` to bypass and
+    refresh the cached entry. Results carrying an ``"error"`` key are never
+    cached; neither are calls that raise.
+
+    Concurrent misses for the same key are coalesced: the first caller makes
+    the upstream request and the others wait for (and share) its outcome.
+    """
+
+    def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+        cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        inflight: dict[Hashable, Future] = {}
+        inflight_lock = threading.Lock()
+
+        @functools.wraps(fn)
+        def wrapper(
+            params: dict[str, Any], *args: Any, force_refresh: bool = False
+        ) -> Any:
+            key = make_params_cache_key(params)
+            if not force_refresh:
+                cached = cache.get(key)
+                if cached is not None:
+                    return cached
+
+            with inflight_lock:
+                pending = inflight.get(key)
+                if pending is None:
+                    future: Future = Future()
+                    inflight[key] = future
+            if pending is not None:
+                return pending.result()
+
+            try:
+                result = fn(params, *args)
+                if not (isinstance(result, dict) and "error" in result):
+                    cache.set(key, result)
+                future.set_result(result)
+                return result
+            except BaseException as e:
+                future.set_exception(e)
+                raise
+            finally:
+                with inflight_lock:
+                    del inflight[key]
+
+        wrapper.cache = cache  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
+
+
+# HTTP statuses worth retrying: throttling and transient upstream failures
+TRANSIENT_HTTP_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def retry_transient(
+    is_transient: Callable[[BaseException], bool],
+    attempts: int = 3,
+    base_delay: float = 0.5,
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Retry a blocking call with exponential backoff on transient errors.
+
+    Exceptions for which ``is_transient`` returns True are retried up to
+    ``attempts`` calls in total, sleeping ``base_delay * 2**n`` plus a little
+    jitter in between; anything else propagates immediately. Only use this on
+    functions that run off the event loop.
+    """
+
+    def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            for attempt in range(attempts):
+                try:
+                    return fn(*args, **kwargs)
+                except Exception as e:
+                    if attempt == attempts - 1 or not is_transient(e):
+                        raise
+                    time.sleep(base_delay * 2**attempt + random.uniform(0, 0.1))
+
+        return wrapper
+
+    return decorator
 
 
 def format_error_response(error_msg: str) -> dict[str, str]:
@@ -104,10 +621,27 @@ def format_error_response(error_msg: str) -> dict[str, str]:
     return {"error": error_msg}
 
 
+def build_csv_params(fields: dict[str, list[Any] | None]) -> dict[str, str]:
+    """Join non-empty list parameters into comma-separated strings.
+
+    Args:
+        fields: Mapping of parameter name to list of values (or None)
+
+    Returns:
+        Dict containing only the non-empty fields, values joined with commas
+    """
+    # A list comprehension beats map() for the short lists these fields hold
+    return {
+        key: ",".join([str(value) for value in values])
+        for key, values in fields.items()
+        if values
+    }
+
+
 def build_optional_params(
     required_params: dict[str, Any],
     optional_params: dict[str, Any],
-    none_check_fields: set | None = None,
+    none_check_fields: set | frozenset | None = None,
 ) -> dict[str, Any]:
     """Build API parameter dict with optional parameter handling.
 
@@ -124,18 +658,58 @@ def build_optional_params(
     Returns:
         Complete parameter dict ready for API calls
     """
-    params = required_params.copy()
-    none_check_set = none_check_fields or set()
+    none_check = (
+        none_check_fields
+        if isinstance(none_check_fields, frozenset)
+        else frozenset(none_check_fields or ())
+    )
+    try:
+        params = _build_params_cached(
+            tuple((key, type(value), value) for key, value in required_params.items()),
+            tuple((key, type(value), value) for key, value in optional_params.items()),
+            none_check,
+        )
+    except TypeError:
+        # Unhashable values (lists, dicts) cannot be memoized
+        params = _build_params_uncached(
+            required_params.items(), optional_params.items(), none_check
+        )
+    # Callers may mutate the result; never hand out the cached dict itself
+    return dict(params)
 
-    for key, value in optional_params.items():
-        if key in none_check_set:
-            if value is not None:
-                params[key] = value
-        else:
-            if value:  # Truthy check for strings/None filtering
-                params[key] = value
 
-    return params
+def _build_params_uncached(
+    required_items: Iterable[tuple[str, Any]],
+    optional_items: Iterable[tuple[str, Any]],
+    none_check: frozenset[str],
+) -> dict[str, Any]:
+    """Filter optional parameters and merge them over the required ones."""
+    return {
+        **dict(required_items),
+        **{
+            key: value
+            for key, value in optional_items
+            if (value is not None if key in none_check else value)
+        },
+    }
+
+
+# Tool calls repeat a small set of parameter combinations (radii, ratings, ...)
+@functools.lru_cache(maxsize=4096)
+def _build_params_cached(
+    required_items: tuple[tuple[str, type, Any], ...],
+    optional_items: tuple[tuple[str, type, Any], ...],
+    none_check: frozenset[str],
+) -> dict[str, Any]:
+    """Memoized _build_params_uncached over ``(key, type, value)`` items.
+
+    The type is part of the key because 1, 1.0 and True compare and hash equal.
+    """
+    return _build_params_uncached(
+        ((key, value) for key, _, value in required_items),
+        ((key, value) for key, _, value in optional_items),
+        none_check,
+    )
 
 
 def get_nws_headers() -> dict[str, str]:
@@ -146,13 +720,36 @@ def get_nws_headers() -> dict[str, str]:
     }
 
 
+# Module-level NWS session (initialized once, reused across requests)
+_NWS_SESSION = None
+
+
+def get_nws_session() -> requests.Session:
+    """Get the shared keep-alive Session for the NWS API (lazy initialization)."""
+    global _NWS_SESSION
+    if _NWS_SESSION is None:
+        _NWS_SESSION = create_pooled_session(
+            pool_connections=2,
+            pool_maxsize=10,
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.2,
+                status_forcelist=tuple(TRANSIENT_HTTP_STATUSES),
+                allowed_methods=frozenset({"GET"}),
+            ),
+        )
+    return _NWS_SESSION
+
+
 def make_nws_request(endpoint: str) -> dict[str, Any] | None:
     """Make a request to the NWS API with proper error handling."""
     try:
-        response = requests.get(endpoint, headers=get_nws_headers(), timeout=10)
+        response = get_nws_session().get(
+            endpoint, headers=get_nws_headers(), timeout=10
+        )
         response.raise_for_status()
-        return response.json()
-    except requests.exceptions.RequestException as e:
+        return loads_json(response.content)
+    except (requests.exceptions.RequestException, ValueError) as e:
         print(f"Error making request to {endpoint}: {str(e)}")
         return None
 
@@ -1,10 +1,10 @@
 """Data models for the Travel Assistant MCP server."""
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Any, Optional
 
-from amadeus import Client  # type: ignore
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 from travel_assistant.helpers import validate_currency_code, validate_date_format
 
@@ -20,11 +20,11 @@ from mcp_accessibility_models import (  # noqa: F401 # type: ignore
 # =====================================================================
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AppContext:
     """Application context containing shared resources."""
 
-    amadeus_client: Client
+    io_pool: ThreadPoolExecutor
 
 
 # =====================================================================
@@ -119,6 +119,36 @@ class AmadeusFlightSearchParams(BaseModel):
     )
 
 
+# Amadeus passenger-count validation messages
+_PASSENGER_ERRORS = {
+    "adults": "Adults must be between 1 and 9",
+    "seated": "Total number of seated travelers (adults + children) cannot exceed 9",
+    "infants": "Number of infants cannot exceed number of adults",
+}
+
+
+class AmadeusPassengerCounts(BaseModel):
+    """Passenger counts for an Amadeus flight search, checked against GDS limits."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    adults: int | None = None
+    children: int | None = Field(None, ge=0)
+    infants: int | None = Field(None, ge=0)
+
+    @model_validator(mode="after")
+    def check_limits(self) -> "AmadeusPassengerCounts":
+        if self.adults is None:
+            return self
+        if not 1 <= self.adults <= 9:
+            raise ValueError(_PASSENGER_ERRORS["adults"])
+        if self.children and self.adults + self.children > 9:
+            raise ValueError(_PASSENGER_ERRORS["seated"])
+        if self.infants and self.infants > self.adults:
+            raise ValueError(_PASSENGER_ERRORS["infants"])
+        return self
+
+
 # =====================================================================
 # HOTEL SEARCH MODELS
 # =====================================================================
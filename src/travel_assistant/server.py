@@ -1,78 +1,448 @@
-import json
+import argparse
+import asyncio
+import inspect
+import logging
 import os
-from collections.abc import AsyncIterator
+import sys
+import threading
+from collections.abc import AsyncIterator, Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
-from dataclasses import dataclass
-from datetime import datetime
-from typing import Any, Optional
+from datetime import date, timedelta
+from importlib import resources
+from functools import cache, lru_cache, partial, wraps
+from types import SimpleNamespace
+from typing import Any, Optional, TypeVar
 
 import requests
 from amadeus import Client, ResponseError  # type: ignore
 from dotenv import load_dotenv
 from fastmcp import Context, FastMCP
+from geopy.distance import geodesic  # type: ignore
 from geopy.exc import GeocoderTimedOut, GeocoderUnavailable  # type: ignore
+from pydantic import ValidationError
+from starlette.requests import Request
+from starlette.responses import Response
 
-from travel_assistant.clients import SerpAPIClient
+from travel_assistant.clients import AmadeusSessionHTTP, SerpAPIClient
 from travel_assistant.helpers import (
+    KM_PER_MILE,
+    KM_PER_NAUTICAL_MILE,
+    TRANSIENT_HTTP_STATUSES,
+    LazyJSON,
+    PersistentCache,
+    TTLCache,
+    build_csv_params,
     build_optional_params,
+    dumps_json,
     extract_flight_accessibility_from_amadeus,
+    extract_flight_emissions,
     extract_hotel_accessibility,
     format_amadeus_response,
     format_error_response,
     get_exchange_rate_api_key,
+    get_exchange_rate_session,
+    get_geocode_cache,
     get_geolocator,
+    haversine_km,
+    haversine_matrix_km,
+    loads_json,
+    make_geocode_cache_key,
+    now_iso,
+    retry_transient,
+    summarize_co2_emissions,
+    ttl_cached,
 )
+from travel_assistant.models import AmadeusPassengerCounts, AppContext
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# Full API parameter dumps are opt-in; they can be large and are rarely needed
+_MCP_DEBUG = os.getenv("MCP_DEBUG", "").lower() in ("1", "true", "yes")
+
+
+def _log_api_params(params: dict[str, Any]) -> None:
+    """Log outgoing API parameters when MCP_DEBUG is enabled."""
+    if _MCP_DEBUG:
+        logger.debug("API parameters: %s", LazyJSON(params))
+
+
+T = TypeVar("T")
+
 # =====================================================================
 # APPLICATION CONTEXT AND LIFECYCLE
 # =====================================================================
 
 
-@dataclass
-class AppContext:
-    amadeus_client: Client
+# Resolved in tool bodies on the event loop thread before any I/O pool dispatch,
+# so first calls never race and lru_cache needs no extra lock
+@lru_cache(maxsize=1)
+def _get_amadeus_client() -> Optional[Client]:
+    """Get the shared Amadeus client, built on first use (None without credentials)."""
+    api_key = os.environ.get("AMADEUS_API_KEY")
+    api_secret = os.environ.get("AMADEUS_API_SECRET")
+    if not (api_key and api_secret):
+        return None
+    try:
+        return Client(
+            client_id=api_key,
+            client_secret=api_secret,
+            http=AmadeusSessionHTTP(),
+        )
+    except Exception:
+        # Log but don't fail - Amadeus tools will handle missing client gracefully
+        return None
 
 
 @asynccontextmanager
 async def app_lifespan(server: FastMCP) -> AsyncIterator[AppContext]:
-    """Manage Amadeus client lifecycle"""
-    api_key = os.environ.get("AMADEUS_API_KEY")
-    api_secret = os.environ.get("AMADEUS_API_SECRET")
-
-    amadeus_client = None
-    if api_key and api_secret:
-        try:
-            amadeus_client = Client(client_id=api_key, client_secret=api_secret)
-        except Exception:
-            # Log but don't fail startup - Amadeus tools will handle missing client gracefully
-            pass
+    """Manage the shared I/O worker pool lifecycle"""
+    # Shared worker threads for blocking SDK/HTTP calls fanned out by async tools
+    io_pool = ThreadPoolExecutor(max_workers=16, thread_name_prefix="mcp-io")
 
     try:
-        yield AppContext(amadeus_client=amadeus_client)
+        yield AppContext(io_pool=io_pool)
     finally:
-        pass
+        io_pool.shutdown(wait=False, cancel_futures=True)
 
 
 # Initialize FastMCP server with lifespan
 mcp = FastMCP("Travel Concierge", lifespan=app_lifespan)
 
 
+# Pre-serialized health payload; only the timestamp is filled in per request
+_HEALTH_TEMPLATE = (
+    b'{"status":"healthy","service":"Travel Concierge",'
+    b'"timestamp":"%s","version":"4.0.0"}'
+)
+
+# Last rendered health body and the timestamp it carries; probes within the
+# same second reuse the bytes as-is
+_HEALTH_BODY_CACHE: tuple[str, bytes] = ("", b"")
+
+
+def _health_body() -> bytes:
+    """Render the /health payload, at most once per second."""
+    global _HEALTH_BODY_CACHE
+    timestamp = now_iso()
+    cached_timestamp, body = _HEALTH_BODY_CACHE
+    if timestamp != cached_timestamp:
+        body = _HEALTH_TEMPLATE % timestamp.encode()
+        _HEALTH_BODY_CACHE = (timestamp, body)
+    return body
+
+
 # Add health check endpoint
 @mcp.custom_route("/health", methods=["GET"])
-async def health_check(request):
+async def health_check(request: Request) -> Response:
     """Health check endpoint for monitoring and load balancers."""
-    return {
-        "status": "healthy",
-        "service": "Travel Concierge",
-        "timestamp": datetime.now().isoformat(),
-        "version": "4.0.0",
-    }
+    return Response(_health_body(), media_type="application/json")
+
+
+# Built on first use; the cached SerpAPI fetchers run on io_pool threads, so
+# concurrent first calls are serialized to avoid building throwaway pools
+_SERPAPI_CLIENT: SerpAPIClient | None = None
+_SERPAPI_CLIENT_LOCK = threading.Lock()
+
+
+def _get_serpapi_client() -> SerpAPIClient:
+    """Get the shared SerpAPI client, built once on first use (thread-safe)."""
+    global _SERPAPI_CLIENT
+    client = _SERPAPI_CLIENT
+    if client is None:
+        with _SERPAPI_CLIENT_LOCK:
+            if _SERPAPI_CLIENT is None:
+                _SERPAPI_CLIENT = SerpAPIClient()
+            client = _SERPAPI_CLIENT
+    return client
+
+
+async def _run_io(ctx: Context, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking SDK/HTTP call on the shared I/O pool, off the event loop."""
+    io_pool = ctx.request_context.lifespan_context.io_pool
+    return await asyncio.get_running_loop().run_in_executor(
+        io_pool, partial(fn, *args, **kwargs)
+    )
+
+
+def amadeus_tool(
+    optional_api: bool = False,
+) -> Callable[[Callable[..., Awaitable[Any]]], Callable[..., Awaitable[str]]]:
+    """Wrap an async Amadeus tool with shared error mapping and formatting.
+
+    The wrapped tool returns the raw Amadeus body, or an error dict from
+    format_error_response (e.g. a validation error) that is passed through
+    unchanged; the decorator formats bodies, logs failures to the MCP context
+    and maps exceptions to error responses. Set optional_api for endpoints
+    that older SDK versions may not expose.
+    """
+
+    def decorator(fn: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[str]]:
+        signature = inspect.signature(fn)
+
+        @wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> str:
+            ctx = signature.bind_partial(*args, **kwargs).arguments.get("ctx")
+            try:
+                result = await fn(*args, **kwargs)
+                if "error" in result:
+                    return result
+                return format_amadeus_response(result)
+            except ResponseError as error:
+                error_msg = f"Amadeus API error: {str(error)}"
+                suffix = ""
+            except AttributeError as e:
+                if not optional_api:
+                    error_msg = f"Unexpected error: {str(e)}"
+                    suffix = ""
+                else:
+                    error_msg = (
+                        "Tours and Activities API not available in current SDK "
+                        f"version: {str(e)}"
+                    )
+                    suffix = (
+                        " (This API might require a newer SDK version or special access)"
+                    )
+            except Exception as e:
+                error_msg = f"Unexpected error: {str(e)}"
+                suffix = ""
+            if ctx is not None:
+                await ctx.info(f"Error: {error_msg}")
+            return format_error_response(error_msg + suffix)
+
+        return wrapper
+
+    return decorator
+
+
+# Short-lived caches for repeated searches; agents often re-issue the same query.
+# Priced Amadeus offers go stale fastest; event listings and hotel reference
+# lists change rarely.
+_SEARCH_CACHE_TTL = float(os.getenv("TRAVEL_CACHE_TTL", "180"))
+_OFFER_CACHE_TTL = 60.0
+_REFERENCE_CACHE_TTL = 1800.0
+_EVENT_CACHE_TTL = max(_SEARCH_CACHE_TTL, 1800.0)
+_FLIGHT_CACHE_TTL = 300.0
+
+
+@ttl_cached(ttl=_FLIGHT_CACHE_TTL, maxsize=1024)
+def _fetch_serpapi_flights(params: dict[str, Any]) -> dict[str, Any]:
+    """Fetch Google Flights results, trimmed to ``params["max_results"]``."""
+    search = dict(params)
+    max_results = search.pop("max_results", None)
+    return _get_serpapi_client().search_flights(max_results=max_results, **search)
+
+
+@ttl_cached(ttl=_SEARCH_CACHE_TTL, maxsize=2048)
+def _fetch_serpapi_hotels(params: dict[str, Any]) -> dict[str, Any]:
+    """Fetch Google Hotels results for a search."""
+    return _get_serpapi_client().search_hotels(**params)
+
+
+@ttl_cached(ttl=_EVENT_CACHE_TTL, maxsize=1024)
+def _fetch_serpapi_events(params: dict[str, Any]) -> dict[str, Any]:
+    """Fetch Google Events results for a search."""
+    return _get_serpapi_client().search_events(**params)
+
+
+# Speculative hotel searches after a flight search spend SerpAPI quota, so
+# they are opt-in and capped to stay out of the way of foreground requests
+_PREFETCH_HOTELS = os.getenv("TRAVEL_PREFETCH_HOTELS", "").lower() in ("1", "true", "yes")
+_PREFETCH_NIGHTS = (2, 3, 5, 7)
+_PREFETCH_SEMAPHORE = asyncio.Semaphore(2)
+_PREFETCH_TASKS: set[asyncio.Task] = set()
+
+
+def _arrival_city(flight_data: dict[str, Any], arrival_id: str) -> str:
+    """Best-effort city name for a Google Flights arrival airport."""
+    for airports in flight_data.get("airports", [])[:1]:
+        for arrival in airports.get("arrival", [])[:1]:
+            return arrival.get("city") or arrival_id
+    return arrival_id
+
+
+async def _prefetch_hotels(
+    ctx: Context,
+    location: str,
+    check_in_date: str,
+    check_out_date: str | None,
+    adults: int,
+    currency: str,
+    country: str,
+    language: str,
+) -> None:
+    """Warm the hotel cache with the stays that usually follow a flight search.
+
+    A round trip prefetches the stay between the two flights; otherwise the
+    common stay lengths in _PREFETCH_NIGHTS are tried. Parameters mirror
+    search_hotels_serpapi's defaults so a matching follow-up search is served
+    from _fetch_serpapi_hotels' cache.
+    """
+    if check_out_date:
+        check_out_dates = [check_out_date]
+    else:
+        check_in = date.fromisoformat(check_in_date)
+        check_out_dates = [
+            (check_in + timedelta(days=nights)).isoformat()
+            for nights in _PREFETCH_NIGHTS
+        ]
+
+    async def fetch(check_out: str) -> None:
+        params = {
+            "q": location,
+            "check_in_date": check_in_date,
+            "check_out_date": check_out,
+            "adults": adults,
+            "children": 0,
+            "currency": currency,
+            "gl": country,
+            "hl": language,
+        }
+        async with _PREFETCH_SEMAPHORE:
+            try:
+                await _run_io(ctx, _fetch_serpapi_hotels, params)
+            except Exception:
+                logger.debug("Hotel prefetch failed for %s", location, exc_info=True)
+
+    await asyncio.gather(*(fetch(check_out) for check_out in check_out_dates))
+
+
+def _schedule_hotel_prefetch(ctx: Context, *args: Any) -> None:
+    """Start _prefetch_hotels in the background, keeping the task referenced."""
+    task = asyncio.create_task(_prefetch_hotels(ctx, *args))
+    _PREFETCH_TASKS.add(task)
+    task.add_done_callback(_log_prefetch_result)
+
+
+def _log_prefetch_result(task: asyncio.Task) -> None:
+    """Drop a finished prefetch task and log why it failed, if it did."""
+    _PREFETCH_TASKS.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.debug("Hotel prefetch aborted", exc_info=task.exception())
+
+
+def _is_transient_amadeus_error(error: BaseException) -> bool:
+    """Whether an Amadeus SDK error is throttling or a transient server/network fault."""
+    if not isinstance(error, ResponseError):
+        return False
+    status = getattr(error.response, "status_code", None)
+    return status in TRANSIENT_HTTP_STATUSES or error.code == "NetworkError"
+
+
+@ttl_cached(ttl=_OFFER_CACHE_TTL, maxsize=1024)
+@retry_transient(_is_transient_amadeus_error)
+def _fetch_amadeus_flight_offers(
+    params: dict[str, Any], amadeus_client: Client
+) -> dict[str, Any]:
+    """Fetch Amadeus flight offers."""
+    return amadeus_client.shopping.flight_offers_search.get(**params).body
 
 
-# Initialize API clients (created once per server instance)
-serpapi_client = SerpAPIClient()
+@ttl_cached(ttl=_REFERENCE_CACHE_TTL, maxsize=2048)
+@retry_transient(_is_transient_amadeus_error)
+def _fetch_amadeus_hotels_by_city(
+    params: dict[str, Any], amadeus_client: Client
+) -> dict[str, Any]:
+    """Fetch the Amadeus hotel list for a city."""
+    return amadeus_client.reference_data.locations.hotels.by_city.get(**params).body
+
+
+@ttl_cached(ttl=_REFERENCE_CACHE_TTL, maxsize=2048)
+@retry_transient(_is_transient_amadeus_error)
+def _fetch_amadeus_hotels_by_geocode(
+    params: dict[str, Any], amadeus_client: Client
+) -> dict[str, Any]:
+    """Fetch the Amadeus hotel list around coordinates."""
+    return amadeus_client.reference_data.locations.hotels.by_geocode.get(
+        **params
+    ).body
+
+
+@ttl_cached(ttl=_OFFER_CACHE_TTL, maxsize=2048)
+@retry_transient(_is_transient_amadeus_error)
+def _fetch_amadeus_hotel_offers(
+    params: dict[str, Any], amadeus_client: Client
+) -> dict[str, Any]:
+    """Fetch Amadeus hotel offers."""
+    return amadeus_client.shopping.hotel_offers.get(**params).body
+
+
+@ttl_cached(ttl=_SEARCH_CACHE_TTL, maxsize=2048)
+@retry_transient(_is_transient_amadeus_error)
+def _fetch_amadeus_activities(
+    params: dict[str, Any], amadeus_client: Client
+) -> dict[str, Any]:
+    """Fetch Amadeus tours and activities around coordinates."""
+    return amadeus_client.shopping.activities.get(**params).body
+
+
+def _limit_amadeus_data(body: Any, limit: Optional[int]) -> Any:
+    """Return body with its "data" list cut to limit entries.
+
+    Cached bodies are shared between calls, so the trimmed result is a
+    shallow copy and the cached list is left intact.
+    """
+    if limit is None or not isinstance(body, dict):
+        return body
+    data = body.get("data")
+    if not isinstance(data, list) or len(data) <= limit:
+        return body
+    return {**body, "data": data[: max(limit, 0)]}
+
+
+# Google Flights display names, indexed by SerpAPI's numeric codes
+_TRAVEL_CLASS_NAMES = ("Economy", "Premium economy", "Business", "First")
+_TRIP_TYPES = {1: "Round trip", 2: "One way", 3: "Multi-city"}
+
+# IATA Special Service Request codes shared by flight results and prompts,
+# mapped to a short description (empty when the code is self-explanatory)
+_SSR_CODES = {
+    "WCHR": "wheelchair",
+    "WCHS": "wheelchair with stowage",
+    "STCR": "stretcher",
+    "DEAF": "",
+    "BLND": "",
+    "PRMK": "mobility disability",
+}
+_SSR_CODES_SUMMARY = ", ".join(
+    f"{code} ({description})" if description else code
+    for code, description in _SSR_CODES.items()
+)
+_FLIGHT_ACCESSIBILITY_NOTE = (
+    "For accessibility requirements (wheelchair, deaf, blind, stretcher), "
+    "contact airlines directly with IATA Special Service Request (SSR) codes: "
+    + _SSR_CODES_SUMMARY
+)
+
+# Google Hotels property fields returned to clients; heavy fields such as
+# images, nearby_places and per-source prices are dropped
+_HOTEL_KEEP_KEYS = (
+    "name",
+    "type",
+    "description",
+    "link",
+    "property_token",
+    "gps_coordinates",
+    "check_in_time",
+    "check_out_time",
+    "rate_per_night",
+    "total_rate",
+    "hotel_class",
+    "extracted_hotel_class",
+    "overall_rating",
+    "reviews",
+    "amenities",
+)
+
+# Google Events fields that only carry image URLs
+_EVENT_DROP_KEYS = frozenset({"thumbnail", "image"})
+
+# Amadeus optional parameters where 0/False are meaningful values
+_FLIGHT_NONE_CHECK = frozenset({"children", "infants", "nonStop", "maxPrice", "max"})
+_HOTEL_LOC_NONE_CHECK = frozenset({"radius"})
+_HOTEL_OFFERS_NONE_CHECK = frozenset({"roomQuantity", "includeClosed", "bestRateOnly"})
 
 # =====================================================================
 # COMBINED FLIGHT SEARCH TOOLS
@@ -80,10 +450,11 @@ serpapi_client = SerpAPIClient()
 
 
 @mcp.tool()
-def search_flights_serpapi(
+async def search_flights_serpapi(
     departure_id: str,
     arrival_id: str,
     outbound_date: str,
+    ctx: Context,
     return_date: str | None = None,
     trip_type: int = 1,
     adults: int = 1,
@@ -95,8 +466,9 @@ def search_flights_serpapi(
     country: str = "us",
     language: str = "en",
     max_results: int = 10,
+    force_refresh: bool = False,
 ) -> dict[str, Any]:
-    """Searches Google Flights for best deals and routes with carbon emissions data. Takes departure location, arrival destination, outbound date, optional return date, passenger counts by type (adults, children, infants), seat class, currency, language, and max results. Returns curated flight options with prices, schedules, airline booking links, and CO2 emissions per flight ranked by value."""
+    """Searches Google Flights for best deals and routes with carbon emissions data. Takes departure location, arrival destination, outbound date, optional return date, passenger counts by type (adults, children, infants), seat class, currency, language, and max results. Returns curated flight options with prices, schedules, airline booking links, and CO2 emissions per flight ranked by value. Repeated identical searches are served from a 5-minute cache; set force_refresh to bypass it."""
 
     try:
         # Build search parameters (client adds engine and api_key)
@@ -120,27 +492,18 @@ def search_flights_serpapi(
             params["return_date"] = return_date
 
         # Make API request (client handles engine, api_key, timeout)
-        flight_data = serpapi_client.search_flights(**params)
-
-        # Extract and process emissions data from flights
-        def extract_emissions(flights):
-            """Extract carbon emissions data from flight list."""
-            processed_flights = []
-            for flight in flights:
-                flight_copy = flight.copy()
-                # Extract carbon_emissions if present
-                if "carbon_emissions" in flight:
-                    emissions = flight.get("carbon_emissions", {})
-                    flight_copy["carbon_emissions"] = {
-                        "this_flight_grams": emissions.get("this_flight"),
-                        "typical_for_route_grams": emissions.get(
-                            "typical_for_this_route"
-                        ),
-                        "difference_percent": emissions.get("difference_percent"),
-                        "note": "Negative difference % indicates lower emissions than typical for this route",
-                    }
-                processed_flights.append(flight_copy)
-            return processed_flights
+        flight_data = await _run_io(
+            ctx,
+            _fetch_serpapi_flights,
+            {**params, "max_results": max_results},
+            force_refresh=force_refresh,
+        )
+
+        # Extract emissions data from both flight groups in one pass
+        best_flights, other_flights = (
+            extract_flight_emissions(flight_data.get(key, []))
+            for key in ("best_flights", "other_flights")
+        )
 
         # Process flight results
         processed_results = {
@@ -150,37 +513,37 @@ def search_flights_serpapi(
                 "arrival": arrival_id,
                 "outbound_date": outbound_date,
                 "return_date": return_date,
-                "trip_type": (
-                    "Round trip"
-                    if trip_type == 1
-                    else "One way"
-                    if trip_type == 2
-                    else "Multi-city"
-                ),
+                "trip_type": _TRIP_TYPES.get(trip_type, "Multi-city"),
                 "passengers": {
                     "adults": adults,
                     "children": children,
                     "infants_in_seat": infants_in_seat,
                     "infants_on_lap": infants_on_lap,
                 },
-                "travel_class": ["Economy", "Premium economy", "Business", "First"][
-                    travel_class - 1
-                ],
+                "travel_class": _TRAVEL_CLASS_NAMES[travel_class - 1],
                 "currency": currency,
                 "emissions_included": True,
-                "accessibility_note": "For accessibility requirements (wheelchair, deaf, blind, stretcher), contact airlines directly with IATA Special Service Request (SSR) codes: WCHR (wheelchair), WCHS (wheelchair with stowage), STCR (stretcher), DEAF, BLND, PRMK (mobility disability)",
-                "search_timestamp": datetime.now().isoformat(),
+                "accessibility_note": _FLIGHT_ACCESSIBILITY_NOTE,
+                "search_timestamp": now_iso(),
             },
-            "best_flights": extract_emissions(
-                flight_data.get("best_flights", [])[:max_results]
-            ),
-            "other_flights": extract_emissions(
-                flight_data.get("other_flights", [])[:max_results]
-            ),
+            "best_flights": best_flights,
+            "other_flights": other_flights,
             "price_insights": flight_data.get("price_insights", {}),
             "airports": flight_data.get("airports", []),
         }
 
+        if _PREFETCH_HOTELS and "error" not in flight_data:
+            _schedule_hotel_prefetch(
+                ctx,
+                _arrival_city(flight_data, arrival_id),
+                outbound_date,
+                return_date if trip_type == 1 else None,
+                adults,
+                currency,
+                country,
+                language,
+            )
+
         return processed_results
 
     except ValueError as e:
@@ -190,7 +553,7 @@ def search_flights_serpapi(
 
 
 @mcp.tool()
-def search_flights_amadeus(
+async def search_flights_amadeus(
     originLocationCode: str,
     destinationLocationCode: str,
     departureDate: str,
@@ -206,20 +569,19 @@ def search_flights_amadeus(
     currencyCode: Optional[str] = None,
     maxPrice: Optional[int] = None,
     max: int = 250,
+    force_refresh: bool = False,
 ) -> str:
-    """Searches Amadeus Global Distribution System for professional flight offers with carbon emissions data. Takes departure/arrival airport codes (IATA), travel dates, passenger counts, seat classes, airline filters, and optional preferences. Returns curated flight options with pricing, schedules, seat availability, booking confirmation numbers, and per-cabin CO2 emissions."""
-    if adults and not (1 <= adults <= 9):
-        return format_error_response("Adults must be between 1 and 9")
-
-    if children and infants and adults and (adults + children > 9):
-        return format_error_response(
-            "Total number of seated travelers (adults + children) cannot exceed 9"
-        )
-
-    if infants and adults and (infants > adults):
-        return format_error_response("Number of infants cannot exceed number of adults")
-
-    amadeus_client = ctx.request_context.lifespan_context.amadeus_client
+    """Searches Amadeus Global Distribution System for professional flight offers with carbon emissions data. Takes departure/arrival airport codes (IATA), travel dates, passenger counts, seat classes, airline filters, and optional preferences. Returns curated flight options with pricing, schedules, seat availability, booking confirmation numbers, and per-cabin CO2 emissions. Repeated identical searches are served from a 1-minute cache; set force_refresh to bypass it."""
+    try:
+        AmadeusPassengerCounts(adults=adults, children=children, infants=infants)
+    except ValidationError as e:
+        error = e.errors()[0]
+        # Surface our own messages without pydantic's "Value error, " prefix
+        if error["type"] == "value_error":
+            return format_error_response(str(error["ctx"]["error"]))
+        return format_error_response(f"{error['loc'][0]}: {error['msg']}")
+
+    amadeus_client = _get_amadeus_client()
     params = build_optional_params(
         required_params={
             "originLocationCode": originLocationCode,
@@ -239,62 +601,57 @@ def search_flights_amadeus(
             "maxPrice": maxPrice,
             "max": max,
         },
-        none_check_fields={"children", "infants", "nonStop", "maxPrice", "max"},
+        none_check_fields=_FLIGHT_NONE_CHECK,
     )
 
     try:
-        ctx.info(
+        await ctx.debug(
             f"Searching Amadeus flights from {originLocationCode} to {destinationLocationCode}"
         )
-        ctx.info(f"API parameters: {json.dumps(params)}")
-
-        response = amadeus_client.shopping.flight_offers_search.get(**params)
-        result = response.body
+        _log_api_params(params)
+
+        body = await _run_io(
+            ctx,
+            _fetch_amadeus_flight_offers,
+            params,
+            amadeus_client,
+            force_refresh=force_refresh,
+        )
+        # The body may be shared through the cache; annotate copies only
+        result = dict(body)
 
-        # Process emissions and accessibility data from flight offers
+        # Process emissions and accessibility data in one pass over the offers
+        emissions_included = False
         if "data" in result and isinstance(result["data"], list):
+            inv_adults = 1.0 / (adults or 1)
+            offers = []
             for flight_offer in result["data"]:
-                # Extract and format co2Emissions if present
-                if "co2Emissions" in flight_offer:
-                    emissions_array = flight_offer.get("co2Emissions", [])
-                    flight_offer["co2_emissions_summary"] = {
-                        "emissions_by_cabin": [
-                            {
-                                "cabin": emission.get("cabin", "UNKNOWN"),
-                                "weight_kg": emission.get("weight"),
-                                "per_passenger_kg": round(
-                                    emission.get("weight", 0) / (adults or 1), 2
-                                ),
-                            }
-                            for emission in emissions_array
-                        ],
-                        "total_weight_kg": sum(
-                            e.get("weight", 0) for e in emissions_array
-                        ),
-                        "unit": "kilograms",
-                    }
+                flight_offer = dict(flight_offer)
+                co2_emissions = flight_offer.get("co2Emissions")
+                if co2_emissions is not None:
+                    flight_offer["co2_emissions_summary"] = summarize_co2_emissions(
+                        co2_emissions, inv_adults
+                    )
 
-                # Extract accessibility information
                 flight_offer["accessibility"] = (
                     extract_flight_accessibility_from_amadeus(flight_offer)
                 )
+                offers.append(flight_offer)
+            result["data"] = offers
+            emissions_included = bool(offers) and "co2Emissions" in offers[0]
 
         result["provider"] = "Amadeus GDS"
-        result["emissions_included"] = bool(
-            "co2Emissions" in result.get("data", [{}])[0]
-            if result.get("data")
-            else False
-        )
+        result["emissions_included"] = emissions_included
         result["accessibility_included"] = True
-        result["search_timestamp"] = datetime.now().isoformat()
-        return json.dumps(result)
+        result["search_timestamp"] = now_iso()
+        return dumps_json(result)
     except ResponseError as error:
         error_msg = f"Amadeus API error: {str(error)}"
-        ctx.info(f"Error: {error_msg}")
+        await ctx.info(f"Error: {error_msg}")
         return format_error_response(error_msg)
     except Exception as e:
         error_msg = f"Unexpected error: {str(e)}"
-        ctx.info(f"Error: {error_msg}")
+        await ctx.info(f"Error: {error_msg}")
         return format_error_response(error_msg)
 
 
@@ -304,10 +661,11 @@ def search_flights_amadeus(
 
 
 @mcp.tool()
-def search_hotels_serpapi(
+async def search_hotels_serpapi(
     location: str,
     check_in_date: str,
     check_out_date: str,
+    ctx: Context,
     adults: int = 2,
     children: int = 0,
     children_ages: list[int] | None = None,
@@ -324,8 +682,9 @@ def search_hotels_serpapi(
     vacation_rentals: bool = False,
     bedrooms: int | None = None,
     max_results: int = 20,
+    force_refresh: bool = False,
 ) -> dict[str, Any]:
-    """Searches Google Hotels for accommodations including hotels, vacation rentals, and boutiques. Takes destination, check-in/out dates, guest count, optional filters (star rating, amenities, brands, property types, free cancellation, special offers). Returns available options with prices, ratings, reviews, photos, and direct booking links."""
+    """Searches Google Hotels for accommodations including hotels, vacation rentals, and boutiques. Takes destination, check-in/out dates, guest count, optional filters (star rating, amenities, brands, property types, free cancellation, special offers). Returns available options with prices, ratings, reviews, and direct booking links. Repeated identical searches are served from a short-lived cache (3 minutes by default); set force_refresh to bypass it."""
 
     try:
         # Build search parameters (client adds engine and api_key)
@@ -340,37 +699,46 @@ def search_hotels_serpapi(
             "hl": language,
         }
 
-        # Add optional parameters
-        if children_ages:
-            params["children_ages"] = ",".join(map(str, children_ages))
+        # Add optional parameters (list filters are sent comma-separated)
+        params.update(
+            build_csv_params(
+                {
+                    "children_ages": children_ages,
+                    "hotel_class": hotel_class,
+                    "amenities": amenities,
+                    "property_types": property_types,
+                    "brands": brands,
+                }
+            )
+        )
+        params.update(
+            (flag, "true")
+            for flag, enabled in (
+                ("free_cancellation", free_cancellation),
+                ("special_offers", special_offers),
+                ("vacation_rentals", vacation_rentals),
+            )
+            if enabled
+        )
         if sort_by:
             params["sort_by"] = sort_by
-        if hotel_class:
-            params["hotel_class"] = ",".join(map(str, hotel_class))
-        if amenities:
-            params["amenities"] = ",".join(map(str, amenities))
-        if property_types:
-            params["property_types"] = ",".join(map(str, property_types))
-        if brands:
-            params["brands"] = ",".join(map(str, brands))
-        if free_cancellation:
-            params["free_cancellation"] = "true"
-        if special_offers:
-            params["special_offers"] = "true"
-        if vacation_rentals:
-            params["vacation_rentals"] = "true"
         if bedrooms:
             params["bedrooms"] = bedrooms
 
-        # Make API request (client handles engine, api_key, timeout)
-        hotel_data = serpapi_client.search_hotels(**params)
-
-        # Process hotel results with accessibility extraction
-        properties = hotel_data.get("properties", [])[:max_results]
+        # Make API request off the event loop (client handles engine, api_key, timeout)
+        hotel_data = await _run_io(
+            ctx, _fetch_serpapi_hotels, params, force_refresh=force_refresh
+        )
 
-        # Extract accessibility information for each property
-        for prop in properties:
-            prop["accessibility"] = extract_hotel_accessibility(prop)
+        # Project to the fields agents use and add accessibility information;
+        # building new dicts also keeps cached upstream results pristine
+        properties = [
+            {
+                **{key: prop[key] for key in _HOTEL_KEEP_KEYS if key in prop},
+                "accessibility": extract_hotel_accessibility(prop),
+            }
+            for prop in hotel_data.get("properties", [])[:max_results]
+        ]
 
         processed_results = {
             "provider": "Google Hotels (SerpAPI)",
@@ -384,7 +752,7 @@ def search_hotels_serpapi(
                     "children_ages": children_ages or [],
                 },
                 "currency": currency,
-                "search_timestamp": datetime.now().isoformat(),
+                "search_timestamp": now_iso(),
             },
             "properties": properties,
             "filters": hotel_data.get("filters", {}),
@@ -402,7 +770,8 @@ def search_hotels_serpapi(
 
 
 @mcp.tool()
-def search_hotels_amadeus_by_city(
+@amadeus_tool()
+async def search_hotels_amadeus_by_city(
     cityCode: str,
     ctx: Context,
     radius: Optional[int] = None,
@@ -411,9 +780,11 @@ def search_hotels_amadeus_by_city(
     amenities: Optional[str] = None,
     ratings: Optional[str] = None,
     hotelSource: Optional[str] = None,
+    max_hotels: Optional[int] = 50,
+    force_refresh: bool = False,
 ) -> str:
-    """Searches Amadeus professional hotel inventory by city IATA code. Takes city code, optional search radius (KM/MI), hotel chain codes, amenities (WiFi, Spa, Pool, etc.), star ratings (1-5), and content source. Returns professional rates, room inventory, cancellation policies, and availability. Use for business travel and professional bookings."""
-    amadeus_client = ctx.request_context.lifespan_context.amadeus_client
+    """Searches Amadeus professional hotel inventory by city IATA code. Takes city code, optional search radius (KM/MI), hotel chain codes, amenities (WiFi, Spa, Pool, etc.), star ratings (1-5), content source, and max_hotels (default 50; null for all). Returns professional rates, room inventory, cancellation policies, and availability. Use for business travel and professional bookings. Repeated identical searches are served from a 30-minute cache; set force_refresh to bypass it."""
+    amadeus_client = _get_amadeus_client()
     params = build_optional_params(
         required_params={"cityCode": cityCode},
         optional_params={
@@ -424,27 +795,25 @@ def search_hotels_amadeus_by_city(
             "ratings": ratings,
             "hotelSource": hotelSource,
         },
-        none_check_fields={"radius"},
+        none_check_fields=_HOTEL_LOC_NONE_CHECK,
     )
 
-    try:
-        ctx.info(f"Searching Amadeus hotels in city: {cityCode}")
-        ctx.info(f"API parameters: {json.dumps(params)}")
+    await ctx.debug(f"Searching Amadeus hotels in city: {cityCode}")
+    _log_api_params(params)
 
-        response = amadeus_client.reference_data.locations.hotels.by_city.get(**params)
-        return format_amadeus_response(response.body)
-    except ResponseError as error:
-        error_msg = f"Amadeus API error: {str(error)}"
-        ctx.info(f"Error: {error_msg}")
-        return format_error_response(error_msg)
-    except Exception as e:
-        error_msg = f"Unexpected error: {str(e)}"
-        ctx.info(f"Error: {error_msg}")
-        return format_error_response(error_msg)
+    body = await _run_io(
+        ctx,
+        _fetch_amadeus_hotels_by_city,
+        params,
+        amadeus_client,
+        force_refresh=force_refresh,
+    )
+    return _limit_amadeus_data(body, max_hotels)
 
 
 @mcp.tool()
-def search_hotels_amadeus_geocode(
+@amadeus_tool()
+async def search_hotels_amadeus_geocode(
     latitude: float,
     longitude: float,
     ctx: Context,
@@ -454,9 +823,11 @@ def search_hotels_amadeus_geocode(
     amenities: Optional[str] = None,
     ratings: Optional[str] = None,
     hotelSource: Optional[str] = None,
+    max_hotels: Optional[int] = 50,
+    force_refresh: bool = False,
 ) -> str:
-    """Searches for hotels near specific coordinates using Amadeus API. Takes latitude, longitude, optional search radius with unit (KM or MI), hotel chain filters, amenity requirements (e.g., SPA, WIFI, POOL), star ratings (1-5), and content source. Returns available hotels sorted by distance with rates, amenities, and booking links."""
-    amadeus_client = ctx.request_context.lifespan_context.amadeus_client
+    """Searches for hotels near specific coordinates using Amadeus API. Takes latitude, longitude, optional search radius with unit (KM or MI), hotel chain filters, amenity requirements (e.g., SPA, WIFI, POOL), star ratings (1-5), content source, and max_hotels (default 50; null for all). Returns available hotels sorted by distance with rates, amenities, and booking links. Repeated identical searches are served from a 30-minute cache; set force_refresh to bypass it."""
+    amadeus_client = _get_amadeus_client()
     params = build_optional_params(
         required_params={"latitude": latitude, "longitude": longitude},
         optional_params={
@@ -467,29 +838,27 @@ def search_hotels_amadeus_geocode(
             "ratings": ratings,
             "hotelSource": hotelSource,
         },
-        none_check_fields={"radius"},
+        none_check_fields=_HOTEL_LOC_NONE_CHECK,
     )
 
-    try:
-        ctx.info(f"Searching Amadeus hotels at coordinates: {latitude}, {longitude}")
-        ctx.info(f"API parameters: {json.dumps(params)}")
-
-        response = amadeus_client.reference_data.locations.hotels.by_geocode.get(
-            **params
-        )
-        return format_amadeus_response(response.body)
-    except ResponseError as error:
-        error_msg = f"Amadeus API error: {str(error)}"
-        ctx.info(f"Error: {error_msg}")
-        return format_error_response(error_msg)
-    except Exception as e:
-        error_msg = f"Unexpected error: {str(e)}"
-        ctx.info(f"Error: {error_msg}")
-        return format_error_response(error_msg)
+    await ctx.debug(
+        f"Searching Amadeus hotels at coordinates: {latitude}, {longitude}"
+    )
+    _log_api_params(params)
+
+    body = await _run_io(
+        ctx,
+        _fetch_amadeus_hotels_by_geocode,
+        params,
+        amadeus_client,
+        force_refresh=force_refresh,
+    )
+    return _limit_amadeus_data(body, max_hotels)
 
 
 @mcp.tool()
-def search_hotel_offers_amadeus(
+@amadeus_tool()
+async def search_hotel_offers_amadeus(
     ctx: Context,
     cityCode: Optional[str] = None,
     hotelIds: Optional[str] = None,
@@ -506,12 +875,14 @@ def search_hotel_offers_amadeus(
     view: Optional[str] = None,
     sort: Optional[str] = None,
     lang: Optional[str] = None,
+    max_offers: Optional[int] = 20,
+    force_refresh: bool = False,
 ) -> str:
-    """Retrieves real-time hotel booking offers from Amadeus. Takes city code or hotel IDs, check-in/out dates, guest count, optional filters (price range, board type, payment policy), currency, and sorting. Returns available room offers with rates, meal plans, and cancellation policies."""
+    """Retrieves real-time hotel booking offers from Amadeus. Takes city code or hotel IDs, check-in/out dates, guest count, optional filters (price range, board type, payment policy), currency, sorting, and max_offers (default 20; null for all). Returns available room offers with rates, meal plans, and cancellation policies. Repeated identical searches are served from a 1-minute cache; set force_refresh to bypass it."""
     if not cityCode and not hotelIds:
         return format_error_response("Either cityCode or hotelIds must be provided")
 
-    amadeus_client = ctx.request_context.lifespan_context.amadeus_client
+    amadeus_client = _get_amadeus_client()
     params = build_optional_params(
         required_params={"adults": adults},
         optional_params={
@@ -530,24 +901,108 @@ def search_hotel_offers_amadeus(
             "sort": sort,
             "lang": lang,
         },
-        none_check_fields={"roomQuantity", "includeClosed", "bestRateOnly"},
+        none_check_fields=_HOTEL_OFFERS_NONE_CHECK,
     )
 
-    try:
-        search_location = cityCode if cityCode else f"hotels {hotelIds}"
-        ctx.info(f"Searching Amadeus hotel offers for: {search_location}")
-        ctx.info(f"API parameters: {json.dumps(params)}")
+    search_location = cityCode if cityCode else f"hotels {hotelIds}"
+    await ctx.debug(f"Searching Amadeus hotel offers for: {search_location}")
+    _log_api_params(params)
 
-        response = amadeus_client.shopping.hotel_offers.get(**params)
-        return format_amadeus_response(response.body)
-    except ResponseError as error:
-        error_msg = f"Amadeus API error: {str(error)}"
-        ctx.info(f"Error: {error_msg}")
-        return format_error_response(error_msg)
-    except Exception as e:
-        error_msg = f"Unexpected error: {str(e)}"
-        ctx.info(f"Error: {error_msg}")
-        return format_error_response(error_msg)
+    body = await _run_io(
+        ctx,
+        _fetch_amadeus_hotel_offers,
+        params,
+        amadeus_client,
+        force_refresh=force_refresh,
+    )
+    return _limit_amadeus_data(body, max_offers)
+
+
+@mcp.tool()
+async def search_hotels_multi_provider(
+    location: str,
+    check_in_date: str,
+    check_out_date: str,
+    ctx: Context,
+    city_code: Optional[str] = None,
+    latitude: Optional[float] = None,
+    longitude: Optional[float] = None,
+    adults: int = 2,
+    currency: str = "USD",
+    radius: Optional[int] = None,
+    radius_unit: str = "KM",
+    max_results: int = 20,
+) -> dict[str, Any]:
+    """Searches Google Hotels and Amadeus hotel inventory concurrently and returns the results side by side. Takes destination name and check-in/out dates for Google Hotels, plus an optional city IATA code (Amadeus by-city search) and/or latitude/longitude (Amadeus by-geocode search) with optional radius. Returns each provider's results or error under its own key, capped at max_results per provider, in roughly the time of the slowest single search."""
+    app_context = ctx.request_context.lifespan_context
+    amadeus_client = _get_amadeus_client()
+    loop = asyncio.get_running_loop()
+
+    searches: dict[str, Any] = {
+        "google": search_hotels_serpapi.fn(
+            location=location,
+            check_in_date=check_in_date,
+            check_out_date=check_out_date,
+            ctx=ctx,
+            adults=adults,
+            currency=currency,
+            max_results=max_results,
+        )
+    }
+    amadeus_params = (
+        {"radius": radius, "radiusUnit": radius_unit} if radius is not None else {}
+    )
+    if amadeus_client is not None:
+        if city_code:
+            searches["amadeus_city"] = loop.run_in_executor(
+                app_context.io_pool,
+                _fetch_amadeus_hotels_by_city,
+                {"cityCode": city_code, **amadeus_params},
+                amadeus_client,
+            )
+        if latitude is not None and longitude is not None:
+            searches["amadeus_geocode"] = loop.run_in_executor(
+                app_context.io_pool,
+                _fetch_amadeus_hotels_by_geocode,
+                {"latitude": latitude, "longitude": longitude, **amadeus_params},
+                amadeus_client,
+            )
+
+    results = await asyncio.gather(*searches.values(), return_exceptions=True)
+
+    providers: dict[str, Any] = {}
+    for name, result in zip(searches, results):
+        if isinstance(result, ResponseError):
+            providers[name] = format_error_response(f"Amadeus API error: {str(result)}")
+        elif isinstance(result, BaseException):
+            providers[name] = format_error_response(f"Unexpected error: {str(result)}")
+        elif name == "google":
+            providers[name] = result
+        else:
+            providers[name] = format_amadeus_response(
+                _limit_amadeus_data(result, max_results)
+            )
+
+    if amadeus_client is None and (city_code or latitude is not None):
+        providers["amadeus"] = format_error_response(
+            "Amadeus client not configured (set AMADEUS_API_KEY and AMADEUS_API_SECRET)"
+        )
+
+    return {
+        "search_metadata": {
+            "location": location,
+            "check_in_date": check_in_date,
+            "check_out_date": check_out_date,
+            "city_code": city_code,
+            "coordinates": (
+                {"latitude": latitude, "longitude": longitude}
+                if latitude is not None and longitude is not None
+                else None
+            ),
+            "search_timestamp": now_iso(),
+        },
+        "providers": providers,
+    }
 
 
 # =====================================================================
@@ -556,16 +1011,18 @@ def search_hotel_offers_amadeus(
 
 
 @mcp.tool()
-def search_events_serpapi(
+async def search_events_serpapi(
     query: str,
+    ctx: Context,
     location: str | None = None,
     date_filter: str | None = None,
     event_type: str | None = None,
     language: str = "en",
     country: str = "us",
     max_results: int = 20,
+    force_refresh: bool = False,
 ) -> dict[str, Any]:
-    """Searches Google Events for local festivals, shows, and experiences. Takes search query (e.g., concerts, festivals), location, optional date filter, event type, language, and country. Returns curated events with dates, times, locations, descriptions, and booking information."""
+    """Searches Google Events for local festivals, shows, and experiences. Takes search query (e.g., concerts, festivals), location, optional date filter, event type, language, and country. Returns curated events with dates, times, locations, descriptions, and booking information. Repeated identical searches are served from a 30-minute cache; set force_refresh to bypass it."""
 
     try:
         # Build search query
@@ -580,14 +1037,19 @@ def search_events_serpapi(
             "gl": country,
         }
 
-        # Add optional filters
+        # Add optional filters; SerpAPI takes several chips comma-separated
+        chips = []
         if date_filter:
-            params["htichips"] = f"date:{date_filter}"
+            chips.append(f"date:{date_filter}")
         if event_type:
-            params["htichips"] = f"event_type:{event_type}"
+            chips.append(f"event_type:{event_type}")
+        if chips:
+            params["htichips"] = ",".join(chips)
 
-        # Make API request (client handles engine, api_key, timeout)
-        event_data = serpapi_client.search_events(**params)
+        # Make API request off the event loop (client handles engine, api_key, timeout)
+        event_data = await _run_io(
+            ctx, _fetch_serpapi_events, params, force_refresh=force_refresh
+        )
 
         # Process event results
         processed_results = {
@@ -599,9 +1061,13 @@ def search_events_serpapi(
                 "event_type": event_type,
                 "language": language,
                 "country": country,
-                "search_timestamp": datetime.now().isoformat(),
+                "search_timestamp": now_iso(),
             },
-            "events": event_data.get("events_results", [])[:max_results],
+            # Copies without image URLs; the cached upstream events stay intact
+            "events": [
+                {k: v for k, v in event.items() if k not in _EVENT_DROP_KEYS}
+                for event in (event_data.get("events_results") or [])[:max_results]
+            ],
             "search_parameters": event_data.get("search_parameters", {}),
         }
 
@@ -614,15 +1080,17 @@ def search_events_serpapi(
 
 
 @mcp.tool()
-def search_activities_amadeus(
+@amadeus_tool(optional_api=True)
+async def search_activities_amadeus(
     latitude: float,
     longitude: float,
     ctx: Context,
     radius: Optional[int] = None,
     radiusUnit: str = "KM",
+    force_refresh: bool = False,
 ) -> str:
-    """Searches Amadeus professional activities and tours by geographic coordinates. Takes latitude, longitude, optional search radius (KM default), returns curated tours and experiences with descriptions, pricing, duration, age/health requirements, cancellation policies, and user ratings. Use for activity planning and booking verified tour operators."""
-    amadeus_client = ctx.request_context.lifespan_context.amadeus_client
+    """Searches Amadeus professional activities and tours by geographic coordinates. Takes latitude, longitude, optional search radius (KM default), returns curated tours and experiences with descriptions, pricing, duration, age/health requirements, cancellation policies, and user ratings. Use for activity planning and booking verified tour operators. Repeated identical searches are served from a short-lived cache (3 minutes by default); set force_refresh to bypass it."""
+    amadeus_client = _get_amadeus_client()
     params = {
         "latitude": latitude,
         "longitude": longitude,
@@ -630,61 +1098,110 @@ def search_activities_amadeus(
         "radiusUnit": radiusUnit,
     }
 
-    try:
-        ctx.info(
-            f"Searching Amadeus tours and activities at coordinates: {latitude}, {longitude}"
-        )
-        ctx.info(f"API parameters: {json.dumps(params)}")
-
-        # Note: This endpoint might be available in newer versions of the Amadeus SDK
-        response = amadeus_client.shopping.activities.get(**params)
-        return format_amadeus_response(response.body)
-    except ResponseError as error:
-        error_msg = f"Amadeus API error: {str(error)}"
-        ctx.info(f"Error: {error_msg}")
-        return format_error_response(error_msg)
-    except AttributeError as e:
-        error_msg = (
-            f"Tours and Activities API not available in current SDK version: {str(e)}"
-        )
-        ctx.info(f"Error: {error_msg}")
-        return format_error_response(
-            error_msg
-            + " (This API might require a newer SDK version or special access)"
-        )
-    except Exception as e:
-        error_msg = f"Unexpected error: {str(e)}"
-        ctx.info(f"Error: {error_msg}")
-        return format_error_response(error_msg)
+    await ctx.debug(
+        f"Searching Amadeus tours and activities at coordinates: {latitude}, {longitude}"
+    )
+    _log_api_params(params)
+
+    # Note: This endpoint might be available in newer versions of the Amadeus SDK
+    return await _run_io(
+        ctx,
+        _fetch_amadeus_activities,
+        params,
+        amadeus_client,
+        force_refresh=force_refresh,
+    )
 
 
 @mcp.tool()
-def get_activity_details_amadeus(activityId: str, ctx: Context) -> str:
+@amadeus_tool(optional_api=True)
+async def get_activity_details_amadeus(activityId: str, ctx: Context) -> str:
     """Retrieves complete activity details from Amadeus. Takes activity ID and returns full information including schedules, pricing, age/health requirements, cancellation policies, and direct booking links."""
-    amadeus_client = ctx.request_context.lifespan_context.amadeus_client
+    amadeus_client = _get_amadeus_client()
 
-    try:
-        ctx.info(f"Getting Amadeus activity details for: {activityId}")
+    await ctx.debug(f"Getting Amadeus activity details for: {activityId}")
 
-        response = amadeus_client.shopping.activity(activityId).get()
-        return format_amadeus_response(response.body)
-    except ResponseError as error:
-        error_msg = f"Amadeus API error: {str(error)}"
-        ctx.info(f"Error: {error_msg}")
-        return format_error_response(error_msg)
-    except AttributeError as e:
-        error_msg = (
-            f"Tours and Activities API not available in current SDK version: {str(e)}"
+    response = await _run_io(ctx, amadeus_client.shopping.activity(activityId).get)
+    return response.body
+
+
+# Caps SerpAPI searches in flight across concurrent trip bundles
+_BUNDLE_SEMAPHORE = asyncio.Semaphore(10)
+
+
+async def _bundled(search: Awaitable[dict[str, Any]]) -> dict[str, Any]:
+    """Await one bundle search under the shared concurrency cap."""
+    async with _BUNDLE_SEMAPHORE:
+        return await search
+
+
+@mcp.tool()
+async def search_trip_bundle(
+    departure_id: str,
+    arrival_id: str,
+    destination: str,
+    outbound_date: str,
+    ctx: Context,
+    return_date: str | None = None,
+    adults: int = 1,
+    currency: str = "USD",
+    include_events: bool = True,
+    max_results: int = 10,
+) -> dict[str, Any]:
+    """Searches flights, hotels, and events for one trip concurrently. Takes departure and arrival airport codes, destination name (for hotels and events), outbound date, optional return date, adult count, currency, and max results per search. Returns Google Flights options, Google Hotels options for the stay (when a return date is given), and local events under their own keys, in roughly the time of the slowest single search."""
+    searches: dict[str, Awaitable[dict[str, Any]]] = {
+        "flights": search_flights_serpapi.fn(
+            departure_id=departure_id,
+            arrival_id=arrival_id,
+            outbound_date=outbound_date,
+            ctx=ctx,
+            return_date=return_date,
+            trip_type=1 if return_date else 2,
+            adults=adults,
+            currency=currency,
+            max_results=max_results,
         )
-        ctx.info(f"Error: {error_msg}")
-        return format_error_response(
-            error_msg
-            + " (This API might require a newer SDK version or special access)"
+    }
+    if return_date:
+        searches["hotels"] = search_hotels_serpapi.fn(
+            location=destination,
+            check_in_date=outbound_date,
+            check_out_date=return_date,
+            ctx=ctx,
+            adults=adults,
+            currency=currency,
+            max_results=max_results,
         )
-    except Exception as e:
-        error_msg = f"Unexpected error: {str(e)}"
-        ctx.info(f"Error: {error_msg}")
-        return format_error_response(error_msg)
+    if include_events:
+        searches["events"] = search_events_serpapi.fn(
+            query="Events",
+            ctx=ctx,
+            location=destination,
+            max_results=max_results,
+        )
+
+    results = await asyncio.gather(
+        *(_bundled(search) for search in searches.values()), return_exceptions=True
+    )
+
+    return {
+        "search_metadata": {
+            "departure": departure_id,
+            "arrival": arrival_id,
+            "destination": destination,
+            "outbound_date": outbound_date,
+            "return_date": return_date,
+            "search_timestamp": now_iso(),
+        },
+        **{
+            name: (
+                format_error_response(f"Unexpected error: {str(result)}")
+                if isinstance(result, BaseException)
+                else result
+            )
+            for name, result in zip(searches, results)
+        },
+    }
 
 
 # =====================================================================
@@ -692,17 +1209,80 @@ def get_activity_details_amadeus(activityId: str, ctx: Context) -> str:
 # =====================================================================
 
 
-@mcp.tool()
-def geocode_location(
+# Nominatim results are stable; cache misses for much less time than hits
+_GEOCODE_TTL = 30 * 86400
+_GEOCODE_NEGATIVE_TTL = 3600
+# In-process layer in front of the SQLite cache; also used when it is disabled,
+# so entries carry the same per-entry TTLs as the SQLite rows
+_GEOCODE_MEMORY_CACHE = TTLCache(maxsize=4096, ttl=_GEOCODE_TTL)
+# Lookups awaiting Nominatim, so concurrent identical queries share one request
+_GEOCODE_INFLIGHT: dict[str, asyncio.Task] = {}
+
+# Nominatim record fields kept by default (address holds the structured parts
+# requested via addressdetails); the full record (bounding box, licence, ...)
+# is returned only when include_raw is set
+_GEOCODE_RAW_KEEP_KEYS = (
+    "address",
+    "osm_type",
+    "osm_id",
+    "place_id",
+    "type",
+    "class",
+    "importance",
+)
+
+
+def _trim_raw(match: dict[str, Any]) -> dict[str, Any]:
+    """Copy a geocode match with its raw_data cut to _GEOCODE_RAW_KEEP_KEYS."""
+    raw = match["raw_data"]
+    return {
+        **match,
+        "raw_data": {key: raw[key] for key in _GEOCODE_RAW_KEEP_KEYS if key in raw},
+    }
+
+
+def _geocode_not_found(location: str) -> dict[str, Any]:
+    """Build the error result for a query Nominatim has no match for."""
+    return {
+        "error": f"Location '{location}' not found",
+        "suggestions": "Try using a more specific address or well-known landmark name",
+    }
+
+
+def _geocode_view(
+    result: dict[str, Any], location: str, include_raw: bool
+) -> dict[str, Any]:
+    """Shape a cached geocode result for the caller without touching the cache.
+
+    Cache keys normalize case, spacing and punctuation, so the echoed location
+    (also in not-found messages) and timestamp are the current caller's rather
+    than those of the first lookup.
+    """
+    if "error" in result:
+        # Only not-found results carry suggestions; service errors have no query
+        return _geocode_not_found(location) if "suggestions" in result else result
+    view = {**result, "location": location, "search_timestamp": now_iso()}
+    if include_raw:
+        return view
+    if "raw_data" in view:
+        return _trim_raw(view)
+    if "multiple_results" in view:
+        view["multiple_results"] = [_trim_raw(m) for m in view["multiple_results"]]
+    return view
+
+
+async def _geocode_uncached(
+    ctx: Context,
+    cache: PersistentCache | None,
+    cache_key: str,
     location: str,
-    exactly_one: bool = True,
-    timeout: int = 10,
-    language: str = "en",
-    addressdetails: bool = True,
-    country_codes: str | None = None,
+    exactly_one: bool,
+    timeout: int,
+    language: str,
+    addressdetails: bool,
+    country_codes: str | None,
 ) -> dict[str, Any]:
-    """Converts place names and addresses to precise geographic coordinates. Takes location query, optional language preference, country filtering (country codes), and match count preference. Returns latitude/longitude, full address details, timezone info, and disambiguation data. Use for flight/hotel searches, activity mapping, and route planning."""
-
+    """Geocode location with Nominatim and store the full result in the caches."""
     try:
         geocode, _ = get_geolocator()
 
@@ -718,13 +1298,16 @@ def geocode_location(
             geocode_params["country_codes"] = country_codes.split(",")
 
         # Perform geocoding
-        result = geocode(location, **geocode_params)
+        result = await _run_io(ctx, geocode, location, **geocode_params)
 
         if not result:
-            return {
-                "error": f"Location '{location}' not found",
-                "suggestions": "Try using a more specific address or well-known landmark name",
-            }
+            not_found = _geocode_not_found(location)
+            _GEOCODE_MEMORY_CACHE.set(cache_key, not_found, ttl=_GEOCODE_NEGATIVE_TTL)
+            if cache is not None:
+                await _run_io(
+                    ctx, cache.set, cache_key, not_found, ttl=_GEOCODE_NEGATIVE_TTL
+                )
+            return not_found
 
         # Process results
         if exactly_one:
@@ -736,7 +1319,7 @@ def geocode_location(
                 },
                 "address": result.address,
                 "raw_data": result.raw,
-                "search_timestamp": datetime.now().isoformat(),
+                "search_timestamp": now_iso(),
             }
         else:
             processed_result = {
@@ -752,9 +1335,14 @@ def geocode_location(
                     }
                     for r in result
                 ],
-                "search_timestamp": datetime.now().isoformat(),
+                "search_timestamp": now_iso(),
             }
 
+        _GEOCODE_MEMORY_CACHE.set(cache_key, processed_result, ttl=_GEOCODE_TTL)
+        if cache is not None:
+            await _run_io(
+                ctx, cache.set, cache_key, processed_result, ttl=_GEOCODE_TTL
+            )
         return processed_result
 
     except (GeocoderTimedOut, GeocoderUnavailable) as e:
@@ -764,38 +1352,136 @@ def geocode_location(
 
 
 @mcp.tool()
-def calculate_distance(
-    lat1: float, lon1: float, lat2: float, lon2: float, unit: str = "km"
+async def geocode_location(
+    location: str,
+    ctx: Context,
+    exactly_one: bool = True,
+    timeout: int = 10,
+    language: str = "en",
+    addressdetails: bool = True,
+    country_codes: str | None = None,
+    include_raw: bool = False,
 ) -> dict[str, Any]:
-    """Calculates geodetic distance between two geographic coordinates. Takes latitude/longitude pairs for two locations and unit preference (km, miles, nm). Returns distance in requested unit plus all formats. Use for route optimization, travel time estimation, and itinerary planning."""
+    """Converts place names and addresses to precise geographic coordinates. Takes location query, optional language preference, country filtering (country codes), and match count preference. Returns latitude/longitude, full address details, timezone info, and disambiguation data (OSM identifiers, place type and importance; set include_raw for the full Nominatim record). Use for flight/hotel searches, activity mapping, and route planning."""
+
+    cache_key = make_geocode_cache_key(
+        location, language, country_codes, exactly_one, addressdetails
+    )
+    cached = _GEOCODE_MEMORY_CACHE.get(cache_key)
+    if cached is not None:
+        return _geocode_view(cached, location, include_raw)
+    cache = get_geocode_cache()
+    if cache is not None:
+        # SQLite reads block; keep them on the I/O pool like the lookup itself
+        cached = await _run_io(ctx, cache.get, cache_key)
+        if cached is not None:
+            ttl = _GEOCODE_NEGATIVE_TTL if "error" in cached else _GEOCODE_TTL
+            _GEOCODE_MEMORY_CACHE.set(cache_key, cached, ttl=ttl)
+            return _geocode_view(cached, location, include_raw)
+
+    task = _GEOCODE_INFLIGHT.get(cache_key)
+    if task is None:
+        task = asyncio.ensure_future(
+            _geocode_uncached(
+                ctx,
+                cache,
+                cache_key,
+                location,
+                exactly_one=exactly_one,
+                timeout=timeout,
+                language=language,
+                addressdetails=addressdetails,
+                country_codes=country_codes,
+            )
+        )
+        _GEOCODE_INFLIGHT[cache_key] = task
+        task.add_done_callback(lambda _: _GEOCODE_INFLIGHT.pop(cache_key, None))
+    # Identical lookups share the task; shielding it means a cancelled caller
+    # (e.g. a disconnected client) never cancels the lookup for the others
+    return _geocode_view(await asyncio.shield(task), location, include_raw)
 
-    try:
-        from geopy.distance import geodesic
 
-        point1 = (lat1, lon1)
-        point2 = (lat2, lon2)
+# Upper bound on locations per batch; Nominatim allows one uncached lookup/second
+_GEOCODE_BATCH_MAX = 50
 
-        # Calculate distance
-        distance = geodesic(point1, point2)
 
-        # Convert to requested unit
-        if unit.lower() == "miles":
-            distance_value = distance.miles
-        elif unit.lower() == "nm":
-            distance_value = distance.nautical
-        else:  # default to kilometers
-            distance_value = distance.kilometers
+@mcp.tool()
+async def geocode_locations_batch(
+    locations: list[str],
+    ctx: Context,
+    language: str = "en",
+    country_codes: str | None = None,
+) -> dict[str, Any]:
+    """Geocodes several place names or addresses in one call. Takes a list of location queries (up to 50), optional language preference and country filtering (country codes). Returns one geocode_location result per input, in the same order. Cached locations return immediately; new lookups follow Nominatim's one-request-per-second policy. Use for mapping whole itineraries."""
+    if len(locations) > _GEOCODE_BATCH_MAX:
+        return {"error": f"At most {_GEOCODE_BATCH_MAX} locations per batch"}
+
+    # The shared RateLimiter spaces out network calls and retries failures;
+    # cache hits don't wait behind it
+    unique = list(dict.fromkeys(locations))
+    results = await asyncio.gather(
+        *(
+            geocode_location.fn(
+                location, ctx=ctx, language=language, country_codes=country_codes
+            )
+            for location in unique
+        )
+    )
+    by_location = dict(zip(unique, results))
+    return {
+        "results": [by_location[location] for location in locations],
+        "search_timestamp": now_iso(),
+    }
+
+
+# Coordinate delta (~1.1 m) below which two points are treated as identical
+_SAME_POINT_DEGREES = 1e-5
+# Kilometers per supported distance unit; anything else falls back to km
+_KM_PER_UNIT = {"km": 1.0, "miles": KM_PER_MILE, "nm": KM_PER_NAUTICAL_MILE}
+
+
+@mcp.tool()
+def calculate_distance(
+    lat1: float,
+    lon1: float,
+    lat2: float,
+    lon2: float,
+    unit: str = "km",
+    high_accuracy: bool = False,
+) -> dict[str, Any]:
+    """Calculates great-circle distance between two geographic coordinates. Takes latitude/longitude pairs for two locations, unit preference (km, miles, nm), and high_accuracy to use the slower ellipsoidal geodesic instead of the haversine approximation. Returns distance in requested unit plus all formats. Use for route optimization, travel time estimation, and itinerary planning."""
+
+    try:
+        if not (-90 <= lat1 <= 90 and -90 <= lat2 <= 90):
+            raise ValueError("Latitude must be in the [-90; 90] range.")
+
+        if (
+            abs(lat1 - lat2) < _SAME_POINT_DEGREES
+            and abs(lon1 - lon2) < _SAME_POINT_DEGREES
+        ):
+            # Same point up to float noise; rounds to 0.0 in every unit anyway
+            kilometers = 0.0
+        elif high_accuracy:
+            kilometers = geodesic((lat1, lon1), (lat2, lon2)).kilometers
+        else:
+            kilometers = haversine_km(lat1, lon1, lat2, lon2)
+        miles = kilometers / KM_PER_MILE
+        nautical = kilometers / KM_PER_NAUTICAL_MILE
+
+        # Convert to requested unit (default to kilometers)
+        distance_value = kilometers / _KM_PER_UNIT.get(unit.lower(), 1.0)
 
         result = {
             "point1": {"latitude": lat1, "longitude": lon1},
             "point2": {"latitude": lat2, "longitude": lon2},
             "distance": {"value": round(distance_value, 2), "unit": unit.lower()},
             "all_units": {
-                "kilometers": round(distance.kilometers, 2),
-                "miles": round(distance.miles, 2),
-                "nautical_miles": round(distance.nautical, 2),
+                "kilometers": round(kilometers, 2),
+                "miles": round(miles, 2),
+                "nautical_miles": round(nautical, 2),
             },
-            "calculation_timestamp": datetime.now().isoformat(),
+            "method": "geodesic" if high_accuracy else "haversine",
+            "calculation_timestamp": now_iso(),
         }
 
         return result
@@ -804,38 +1490,140 @@ def calculate_distance(
         return {"error": f"Distance calculation error: {str(e)}"}
 
 
+# Upper bound on points per matrix; the work grows with the square of the count
+_DISTANCE_MATRIX_MAX = 100
+
+
+@mcp.tool()
+def calculate_distance_matrix(
+    points: list[tuple[float, float]], unit: str = "km"
+) -> dict[str, Any]:
+    """Calculates great-circle distances between every pair of coordinates in one call. Takes a list of latitude/longitude pairs (up to 100) and unit preference (km, miles, nm). Returns a symmetric distance matrix in the requested unit, ordered like the input points, using the haversine approximation. Use for itinerary ordering and route optimization across many stops."""
+    if len(points) > _DISTANCE_MATRIX_MAX:
+        return {"error": f"At most {_DISTANCE_MATRIX_MAX} points per matrix"}
+    if any(not -90 <= lat <= 90 for lat, _ in points):
+        return {"error": "Latitude must be in the [-90; 90] range."}
+
+    unit = unit.lower()
+    km_per_unit = _KM_PER_UNIT.get(unit)
+    if km_per_unit is None:
+        unit, km_per_unit = "km", 1.0
+    matrix = haversine_matrix_km(points)
+    return {
+        "points": [{"latitude": lat, "longitude": lon} for lat, lon in points],
+        "unit": unit,
+        "distances": [[round(km / km_per_unit, 2) for km in row] for row in matrix],
+        "method": "haversine",
+        "calculation_timestamp": now_iso(),
+    }
+
+
 # =====================================================================
 # FINANCIAL TOOLS
 # =====================================================================
 
 
+# Rate tables keyed by base currency ({TO: rate}); one /latest/ fetch serves
+# every target, and FX rates move on the order of minutes
+_FX_RATE_CACHE = TTLCache(maxsize=256, ttl=300)
+# Cache validators plus the table they describe, kept for a day so stale tables
+# can be revalidated with a conditional GET instead of a full refetch
+_FX_VALIDATORS = TTLCache(maxsize=256, ttl=86400)
+# Most requests are USD-based, so its table can cross-price other pairs
+_FX_PIVOT_CURRENCY = "USD"
+
+
+class _ExchangeRateError(Exception):
+    """ExchangeRate-API returned a well-formed error that is safe to surface."""
+
+
+def _get_rates(base_currency: str, max_age: float = 300) -> dict[str, float]:
+    """Get all conversion rates from base_currency, serving cached tables when fresh.
+
+    Once a cached table goes stale it is revalidated with a conditional GET when
+    the API supplied an ETag or Last-Modified; a 304 reuses the known table.
+    """
+    rates = _FX_RATE_CACHE.get(base_currency, max_age=max_age)
+    if rates is not None:
+        return rates
+
+    headers = {}
+    validators = _FX_VALIDATORS.get(base_currency)
+    if validators is not None:
+        etag, last_modified, known_rates = validators
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+    api_key = get_exchange_rate_api_key()
+    base_url = f"https://v6.exchangerate-api.com/v6/{api_key}/latest/{base_currency}"
+    response = get_exchange_rate_session().get(base_url, headers=headers, timeout=10)
+    if response.status_code == 304 and validators is not None:
+        _FX_RATE_CACHE.set(base_currency, known_rates)
+        return known_rates
+    response.raise_for_status()
+    data = loads_json(response.content)
+
+    if data.get("result") != "success":
+        raise _ExchangeRateError(data.get("error-type") or "ExchangeRate-API error")
+
+    rates = data.get("conversion_rates")
+    if not rates:
+        raise _ExchangeRateError("Conversion rate not available")
+
+    _FX_RATE_CACHE.set(base_currency, rates)
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if etag or last_modified:
+        _FX_VALIDATORS.set(base_currency, (etag, last_modified, rates))
+    return rates
+
+
+def _get_rate(from_currency: str, to_currency: str, max_age: float = 300) -> float:
+    """Get the conversion rate for a currency pair from the base currency's table.
+
+    When only the reverse pair's table is cached, its inverse rate is used
+    instead of fetching a new table; failing that, a cached table for the
+    pivot currency yields the cross rate.
+    """
+    rates = _FX_RATE_CACHE.get(from_currency, max_age=max_age)
+    if rates is None:
+        reverse = _FX_RATE_CACHE.get(to_currency, max_age=max_age)
+        if reverse and reverse.get(from_currency):
+            return 1 / reverse[from_currency]
+        pivot = _FX_RATE_CACHE.get(_FX_PIVOT_CURRENCY, max_age=max_age)
+        if pivot and pivot.get(from_currency) and to_currency in pivot:
+            return pivot[to_currency] / pivot[from_currency]
+        rates = _get_rates(from_currency, max_age)
+    rate = rates.get(to_currency)
+    if rate is None:
+        raise _ExchangeRateError("unsupported-code")
+    return rate
+
+
 @mcp.tool()
-def convert_currency(
-    from_currency: str, to_currency: str, amount: float = 1.0, language: str = "en"
+async def convert_currency(
+    from_currency: str,
+    to_currency: str,
+    amount: float = 1.0,
+    language: str = "en",
+    max_age: int = 300,
 ) -> dict[str, Any]:
-    """Converts amounts between currencies using real-time exchange rates via ExchangeRate-API. Takes source and target currency codes (USD, EUR, GBP, etc.), optional amount (default 1.0), returns converted amount and current exchange rate. Essential for international travel budgeting, expense tracking, and price comparisons across currencies."""
+    """Converts amounts between currencies using real-time exchange rates via ExchangeRate-API. Takes source and target currency codes (USD, EUR, GBP, etc.), optional amount (default 1.0), returns converted amount and current exchange rate. Rates up to max_age seconds old (default 300, capped at 5 minutes) are served from cache. Essential for international travel budgeting, expense tracking, and price comparisons across currencies."""
+    from_currency = from_currency.strip().upper()
+    to_currency = to_currency.strip().upper()
     try:
-        api_key = get_exchange_rate_api_key()
-        base_url = f"https://v6.exchangerate-api.com/v6/{api_key}/pair/{from_currency.upper()}/{to_currency.upper()}"
-        response = requests.get(base_url, timeout=10)
-        response.raise_for_status()
-        data = response.json()
-
-        if data.get("result") != "success":
-            return {"error": data.get("error-type") or "ExchangeRate-API error"}
-
-        rate = data.get("conversion_rate")
-        if rate is None:
-            return {"error": "Conversion rate not available"}
+        rate = await asyncio.to_thread(_get_rate, from_currency, to_currency, max_age)
 
         converted_amount = round(amount * float(rate), 2)
 
         processed_results = {
             "search_metadata": {
-                "from_currency": from_currency.upper(),
-                "to_currency": to_currency.upper(),
+                "from_currency": from_currency,
+                "to_currency": to_currency,
                 "amount": amount,
-                "search_timestamp": datetime.now().isoformat(),
+                "search_timestamp": now_iso(),
                 "provider": "exchangerate-api",
             },
             "exchange_rate": rate,
@@ -846,7 +1634,9 @@ def convert_currency(
             },
         }
         return processed_results
-    except requests.exceptions.RequestException:
+    except _ExchangeRateError as e:
+        return {"error": str(e)}
+    except (requests.exceptions.RequestException, ValueError):
         # SECURITY: Never expose the URL which contains the API key
         return {
             "error": "Currency API request failed. Please check currency codes and try again."
@@ -856,45 +1646,78 @@ def convert_currency(
         return {"error": "Currency conversion failed. Please try again."}
 
 
-# =====================================================================
-# UNIFIED PROMPTS
-# =====================================================================
-
+@mcp.tool()
+async def convert_currency_multi(
+    from_currency: str,
+    to_currencies: list[str],
+    amount: float = 1.0,
+    max_age: int = 300,
+) -> dict[str, Any]:
+    """Converts one amount into several currencies at once using ExchangeRate-API. Takes a source currency code, a list of target currency codes (e.g. ["EUR", "GBP", "JPY"]), and an optional amount (default 1.0). Returns the converted amount and exchange rate for each target from a single rate fetch; unknown targets are listed separately. Rates up to max_age seconds old (default 300, capped at 5 minutes) are served from cache. Use for comparing prices across several currencies."""
+    from_currency = from_currency.strip().upper()
+    try:
+        rates = await asyncio.to_thread(_get_rates, from_currency, max_age)
+
+        conversions = {}
+        unsupported = []
+        for code in dict.fromkeys(c.strip().upper() for c in to_currencies):
+            rate = rates.get(code)
+            if rate is None:
+                unsupported.append(code)
+                continue
+            conversions[code] = {
+                "converted_amount": round(amount * float(rate), 2),
+                "rate": rate,
+            }
 
-@mcp.prompt()
-def travel_planning_prompt(
-    destination: str,
-    departure_location: str = "",
-    travel_dates: str = "",
-    travelers: int = 1,
-    budget: str = "",
-    interests: str = "",
-    travel_style: str = "",
-) -> str:
-    """Generates comprehensive travel planning combining flights, hotels, activities, and budget optimization."""
+        return {
+            "search_metadata": {
+                "from_currency": from_currency,
+                "amount": amount,
+                "search_timestamp": now_iso(),
+                "provider": "exchangerate-api",
+            },
+            "conversions": conversions,
+            "unsupported_currencies": unsupported,
+        }
+    except _ExchangeRateError as e:
+        return {"error": str(e)}
+    except (requests.exceptions.RequestException, ValueError):
+        # SECURITY: Never expose the URL which contains the API key
+        return {
+            "error": "Currency API request failed. Please check currency codes and try again."
+        }
+    except Exception:
+        # SECURITY: Generic error without exposing implementation details
+        return {"error": "Currency conversion failed. Please try again."}
 
-    prompt = f"""🌟 **WELCOME TO YOUR COMBINED TRAVEL CONCIERGE SERVICE** 🌟
 
-I'm your comprehensive AI travel specialist with access to BOTH Google Travel Services AND Amadeus Professional Systems! Let me plan your perfect journey to {destination}"""
+# =====================================================================
+# UNIFIED PROMPTS
+# =====================================================================
 
-    if departure_location:
-        prompt += f" from {departure_location}"
 
-    if travel_dates:
-        prompt += f" for {travel_dates}"
+def _memoized_prompt(fn: Callable[..., str]) -> Callable[..., str]:
+    """Cache rendered prompt text per argument combination.
 
-    prompt += f" for {travelers} traveler{'s' if travelers != 1 else ''}."
+    Prompt builders are pure functions of their scalar arguments and agents
+    tend to re-request identical prompts. lru_cache is kept behind a plain
+    wrapper so FastMCP still sees an ordinary function signature.
+    """
+    cached = lru_cache(maxsize=256)(fn)
 
-    if budget:
-        prompt += f"\n💰 **Budget**: {budget}"
+    @wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> str:
+        return cached(*args, **kwargs)
 
-    if interests:
-        prompt += f"\n🎯 **Your Interests**: {interests}"
+    wrapper.cache_clear = cached.cache_clear  # type: ignore[attr-defined]
+    wrapper.cache_info = cached.cache_info  # type: ignore[attr-defined]
+    return wrapper
 
-    if travel_style:
-        prompt += f"\n✈️ **Travel Style**: {travel_style}"
 
-    prompt += """
+# Static body of the travel planning prompt (built once at import)
+_TRAVEL_PLANNING_BODY = (
+    """
 # YOUR COMPLETE DUAL-POWERED TRAVEL EXPERIENCE
 
 ## Phase 0 — Swiss Rail & Ground Transport Planning
@@ -926,7 +1749,9 @@ I'm your comprehensive AI travel specialist with access to BOTH Google Travel Se
 
 ## Phase 1 — Flight Discovery & Comparison (with Accessibility)
 - **Google Flights Search** — use `search_flights_serpapi()` for consumer flight options.
-  - *Accessibility note:* Results include guidance on IATA Special Service Request (SSR) codes: WCHR (wheelchair), WCHS (wheelchair with stowage), STCR (stretcher), DEAF, BLND, PRMK (mobility disability).
+  - *Accessibility note:* Results include guidance on IATA Special Service Request (SSR) codes: """
+    + _SSR_CODES_SUMMARY
+    + """.
 - **Amadeus Professional Search** — use `search_flights_amadeus()` for professional airline inventory.
   - *Accessibility note:* Results include accessibility information and SSR code recommendations.
 - Compare results from both systems to find the best deals, access consumer and agent data, and get price insights and schedule optimization.
@@ -998,463 +1823,68 @@ Present everything as an expert travel friend with access to BOTH consumer and p
 
 Let's create your perfect travel experience using BOTH consumer and professional travel platforms, enhanced with Swiss-specific services!
 """
-
-    return prompt
-
-
-@mcp.resource("travel://combined/capabilities")
-def combined_travel_server_capabilities() -> str:
-    """Provides comprehensive reference documentation for all travel server capabilities. Returns detailed guide covering dual-platform tools (Google/SerpAPI and Amadeus), features, API requirements, best practices, and integration strategies for flight, hotel, activity, weather, location, and financial planning."""
-
-    return """# Combined Travel Concierge Server - Complete Capabilities Guide
-
-## Overview
-This combined server integrates the best of both consumer travel platforms (Google via SerpAPI) AND professional travel industry systems (Amadeus GDS) into one powerful platform, providing unparalleled travel planning assistance.
-
-## Dual Flight Search Services
-
-### Consumer Flight Search (Google Flights via SerpAPI)
-**Tool:** `search_flights_serpapi()`
-- Access Google's comprehensive flight database
-- Consumer-friendly pricing and schedule display
-- Price insights and trend analysis
-- Multi-airline comparison with popular routes
-- Family-friendly search with children and infant options
-
-### Professional Flight Search (Amadeus GDS)
-**Tool:** `search_flights_amadeus()`
-- Professional travel agent inventory access
-- Real-time airline seat availability
-- Detailed fare class information
-- Professional booking codes and restrictions
-- Advanced filtering by airline preferences
-
-**Combined Benefits:**
-- Compare consumer vs. professional pricing
-- Access both popular routes AND hidden inventory
-- Get comprehensive view of all available options
-- Professional insights with consumer-friendly presentation
-
-## Comprehensive Hotel Services
-
-### Consumer Hotel Search (Google Hotels via SerpAPI)
-**Tool:** `search_hotels_serpapi()`
-- Vacation rentals, boutique hotels, major chains
-- Consumer reviews and ratings
-- Special offers and package deals
-- Family-friendly filtering with children's ages
-- Flexible cancellation and booking options
-
-### Professional Hotel Search (Amadeus GDS)
-**Tools:** 
-- `search_hotels_amadeus_by_city()` - City-based professional search
-- `search_hotels_amadeus_by_geocode()` - Coordinate-based search
-- `search_hotel_offers_amadeus()` - Real-time availability and pricing
-
-**Professional Features:**
-- Travel industry rates and inventory
-- Real-time room availability
-- Professional booking codes
-- Detailed property amenities and chain information
-- Business travel optimized results
-
-## 🎭 Dual Event & Activity Discovery
-
-### Consumer Events (Google Events via SerpAPI)
-**Tool:** `search_events_serpapi()`
-- Local festivals, concerts, exhibitions
-- Consumer-friendly event discovery
-- Popular attractions and entertainment
-- Virtual events and online experiences
-
-### Professional Activities (Amadeus GDS)
-**Tools:**
-- `search_tours_activities_amadeus()` - Professional tour operations
-- `get_activity_details_amadeus()` - Detailed activity information
-
-**Professional Features:**
-- Curated tour operators and experiences
-- Professional activity bookings
-- Verified experience providers
-- Detailed scheduling and requirements
-
-## Location Intelligence Services
-**Tools Available:**
-- `geocode_location()` - Convert addresses/places to coordinates
-- `calculate_distance()` - Measure distances between locations
-
-**Capabilities:**
-- Precise location identification worldwide
-- Distance calculations for route optimization
-- Multi-language location details
-- Address detail breakdown
-
-## Weather Intelligence Service
-**Tools Available:**
-- `get_weather_forecast()` - Detailed weather forecasts
-- `get_current_conditions()` - Real-time weather data
-
-**Capabilities:**
-- Daily and hourly weather forecasts using Open-Meteo
-- Current temperature, humidity, wind conditions
-- Activity planning based on weather conditions
-- Travel safety considerations
-
-## Financial Services
-**Tools Available:**
-- `convert_currency()` - Real-time currency conversion via ExchangeRate-API
-
-**Capabilities:**
-- Real-time exchange rates for international travel
-- Travel industry investment tracking
-- Budget planning assistance across currencies
-- Financial market insights for travel investments
-
-## Unified Planning Advantages
-
-**Dual Platform Benefits:**
-- **Best Price Discovery**: Compare consumer vs. professional rates
-- **Maximum Inventory Access**: See both popular and hidden options
-- **Professional + Consumer Insights**: Get industry knowledge with user-friendly presentation
-- **Comprehensive Coverage**: Access the widest range of travel options available
-- **Redundancy & Reliability**: If one platform has issues, the other provides backup
-
-**Integration Benefits:**
-- Single server handles all travel needs across multiple platforms
-- Coordinated data sharing between consumer and professional services
-- Unified error handling and comprehensive reporting
-- Consistent API responses across all services
-
-## Technical Specifications
-
-**Required Environment Variables:**
-- `SERPAPI_KEY` - Required for Google Flights, Hotels, Events, and Finance services
-- `AMADEUS_API_KEY` - Required for Amadeus professional services
-- `AMADEUS_API_SECRET` - Required for Amadeus professional services
-- `EXCHANGE_RATE_API_KEY` - Required for currency conversion services
-
-**Dependencies:**
-- requests (API calls)
-- geopy (geocoding services)
-- amadeus (Amadeus GDS access)
-- mcp.server.fastmcp (MCP server framework)
-
-**Error Handling:**
-- Graceful API failure handling across all platforms
-- Fallback mechanisms between consumer and professional services
-- Comprehensive error reporting with platform identification
-- Timeout management and rate limiting compliance
-
-## 🇨🇭 Swiss Travel Ecosystem Integration
-
-This server is part of a **federated MCP ecosystem** for comprehensive Swiss travel planning. When planning Switzerland trips, leverage these specialized companion servers:
-
-### Journey Service MCP (Rail Planning)
-**Server:** `journey-service-mcp`
-**Capabilities:**
-- Real-time SBB train connections with live delays and platform information
-- 126+ stations across Switzerland and neighboring countries
-
-**♿ Accessibility Features:**
-- Wheelchair-accessible route planning with 4 accessibility levels (self-boarding, crew assistance, notification-required, shuttle-transport)
-- Train accessibility data: wheelchair spaces, accessible toilets, visual impairment aids
-- Optimized transfer times for mobility-restricted travelers (10+ minute minimum)
-- Real-time platform accessibility information
-
-**🌍 Ecology Features:**
-- CO2 emissions analysis comparing train vs car vs plane
-- Eco-friendly route recommendations with tree offset calculations
-- Train-based travel routing (lowest carbon footprint for ground transport)
-
-**Additional Features:**
-- Train formation data (car layout, amenities, WiFi zones)
-
-**Key Tools:**
-- `journey__find_trips` — Search train journeys with real-time data
-- `findStopPlacesByName` — Find stations by name
-- `getPlaceEvents` — Live departure boards
-- `compareRoutes` — Compare journey options by multiple criteria
-- `getEcoComparison` — CO2 emissions analysis
-
-### Swiss Mobility MCP (Rail Ticketing)
-**Server:** `swiss-mobility-mcp`
-**Capabilities:**
-- SBB ticket pricing with Half-Fare and GA pass support
-- Booking and reservation management
-- PDF ticket generation
-- Refund processing
-
-**Key Tools:**
-- `mobility__get_trip_pricing` — Calculate SBB fares
-- `createBooking` — Create reservations
-- `getTicketPdf` — Download PDF tickets
-- `cancelBooking` — Cancel reservations
-
-### Swiss Tourism MCP (Attractions & Packages)
-**Server:** `swiss-tourism-mcp`
-**Capabilities:**
-- 283 curated Swiss attractions with detailed information
-- 133 RailAway combo offers (rail + attraction bundles)
-- 19 Swiss Travel System products (passes, discount cards)
-- 12 holiday packages from Switzerland Travel Centre
-- 10 Alpine resorts with seasonal information
-- Multi-day trip planning
-
-**♿ Accessibility Features:**
-- Barrier-free attraction filtering: wheelchair, mobility, pet-friendly, stroller-compatible
-- Comprehensive accessible tourism planning with dedicated prompt covering:
-  - Wheelchair-accessible attractions and accommodations
-  - Level boarding and accessible transport connections
-  - Hotels with roll-in showers and accessible bathrooms
-  - Sensory, cognitive, dietary, and medical needs assessment
-  - Accessible parking and resting areas
-
-**🌍 Ecology Features:**
-- RailAway combo packages promote train+attraction efficiency (lowest carbon option)
-- Multi-day trip planning encourages longer stays (reduced travel frequency)
-
-**Key Tools:**
-- `tourism__search_sights` — Search attractions by category/vibe tags
-- `tourism__search_railaway_products` — Rail+attraction combos
-- `tourism__plan_multi_day_trip` — Generate Swiss itineraries
-- `tourism__search_resorts` — Alpine resort search
-
-### Open-Meteo MCP (Weather Intelligence)
-**Server:** `open-meteo-mcp`
-**Capabilities:**
-- 16-day weather forecasts for Swiss locations
-- Snow depth and mountain conditions
-- Historical weather data (80+ years)
-- Comfort index for outdoor activities
-
-**♿ Accessibility Features:**
-- Weather alerts for safety-critical conditions: heat, cold, storm, UV intensity
-- Pollen data (Europe) for allergy-conscious travelers
-- Real-time air quality index (AQI) for respiratory health planning
-
-**🌍 Ecology Features:**
-- Air quality monitoring: CO, NO₂, SO₂, O₃ levels
-- Environmental condition tracking for low-emission activity planning
-- Weather-based activity optimization (reducing unnecessary travel)
-
-**Key Tools:**
-- `meteo__get_weather` — Detailed forecasts
-- `meteo__get_snow_conditions` — Mountain snow reports
-- `meteo__get_air_quality` — AQI and pollen levels
-- `meteo__get_comfort_index` — Activity comfort score
-
-### Cross-Server Orchestration Examples
-
-**Complete Switzerland Trip Planning:**
-1. Use `meteo__get_weather()` to check conditions
-2. Use `tourism__search_sights()` to find attractions
-3. Use `journey__find_trips()` to plan rail connections
-4. Use `mobility__get_trip_pricing()` to get ticket costs
-5. Use `tourism__search_railaway_products()` for combo deals
-6. Use `search_hotels_serpapi()` (this server) for accommodation
-7. Use `meteo__get_comfort_index()` to optimize activities
-
-**♿ Accessible Trip Planning:**
-1. Use `journey__find_trips()` with wheelchair accessibility filters
-2. Use `tourism__search_sights()` with barrier-free attraction filters
-3. Use `meteo__get_weather_alerts()` for health/safety conditions
-4. Identify wheelchair spaces on trains via `getTrainFormation()`
-5. Use `tourism__plan_multi_day_trip()` with accessible accommodation
-6. Use `mobility__get_trip_pricing()` for appropriate seating/services
-7. Use `meteo__get_air_quality()` for respiratory health planning
-
-**🌍 Eco-Conscious Trip Planning:**
-1. Use `journey__find_trips()` for train-based routes (lowest CO2)
-2. Use `getEcoComparison()` to compare CO2 vs car/plane
-3. Use `tourism__search_railaway_products()` for efficient rail+attraction combos
-4. Use `tourism__plan_multi_day_trip()` to reduce travel frequency
-5. Use `meteo__get_air_quality()` to check environmental conditions
-6. Optimize routes with `calculate_distance()` (this server) for minimal travel
-7. Use `convert_currency()` (this server) for budget-friendly sustainable options
-
-### Federation Setup
-
-**Claude Desktop Configuration:**
-```json
-{
-  "mcpServers": {
-    "travel-concierge": {
-      "command": "uv",
-      "args": ["run", "python", "-m", "travel_assistant.server"]
-    },
-    "journey-service": {
-      "command": "java",
-      "args": ["-jar", "path/to/journey-service-mcp.jar"]
-    },
-    "swiss-mobility": {
-      "command": "java",
-      "args": ["-jar", "path/to/swiss-mobility-mcp.jar"]
-    },
-    "swiss-tourism": {
-      "command": "uv",
-      "args": ["run", "python", "-m", "swiss_tourism_mcp.server"]
-    },
-    "open-meteo": {
-      "command": "uv",
-      "args": ["run", "python", "-m", "open_meteo_mcp.server"]
-    }
-  }
-}
-```
-
-Claude automatically orchestrates across all configured servers for Switzerland-focused trips.
-
-## ♿ Accessibility Features
-
-This server includes comprehensive accessibility support for travelers with mobility, sensory, or other accessibility needs:
-
-### Flight Accessibility
-- **Wheelchair & Mobility:** WCHR (wheelchair), WCHS (wheelchair with stowage), STCR (stretcher), PRMK (passenger with mobility disability)
-- **Sensory Accessibility:** DEAF (deaf passenger), BLND (blind passenger)
-- **Special Meals:** Diabetic, low-sodium, vegetarian, vegan options
-- **Companion Support:** Option to book companion/assistant passengers
-- **Accessible Lavatories:** Aircraft equipped with wheelchair-accessible restrooms
-- **Extra Legroom:** Available for passengers with mobility limitations
-
-**How to Use:**
-1. Search flights with `search_flights_serpapi()` or `search_flights_amadeus()`
-2. Results include accessibility guidance with IATA SSR codes
-3. Contact airline directly with appropriate SSR code
-4. Request accessible seat, special meals, and assistance during booking
-
-### Hotel Accessibility
-- **Wheelchair Accessible Rooms:** Detected via amenity ID 53 (Google Hotels) or facility lists (Amadeus)
-- **Accessible Bathrooms:** Roll-in showers, grab bars, accessible toilets
-- **Accessible Parking:** Dedicated accessible parking spaces
-- **Accessible Entrance:** Level or ramped entry, automatic doors
-- **Accessible Elevators:** Serving all guest floors
-- **Service Animals:** Pet-friendly policies for guide dogs and service animals
-
-**How to Use:**
-1. Search hotels with `search_hotels_serpapi()` or `search_hotels_amadeus_by_city()`
-2. Results include accessibility indicators:
-   - Google Hotels: Amenity ID 53 = wheelchair accessible
-   - Amadeus: Facility list with accessibility features
-3. Check accessibility object in results for detailed information
-4. Filter by specific accessibility needs (wheelchair access, bathroom type, etc.)
-
-### Accessibility Request Model
-Use `AccessibilityRequest` model to document traveler needs:
-- `wheelchair_user` — Uses wheelchair (may require stowage)
-- `reduced_mobility` — General reduced mobility requiring assistance
-- `deaf` — Deaf traveler (needs visual alerts)
-- `blind` — Blind traveler (needs audio assistance)
-- `stretcher_case` — Medical condition requiring stretcher
-- `companion_required` — Traveling with assistant/companion
-- `special_requirements` — Additional medical or mobility needs
-
-### Data Models
-- **FlightAccessibility:** Flight-level accessibility features and SSR codes
-- **HotelAccessibility:** Hotel-level accessibility features and facilities
-- **AccessibilityRequest:** Traveler accessibility requirements
-
-### Best Practices
-1. **Early Communication:** Inform airlines/hotels about accessibility needs during booking
-2. **SSR Codes:** Use proper IATA codes when contacting airlines
-3. **Verification:** Confirm accessibility features exist before arrival
-4. **Alternatives:** Have backup options in case primary choice unavailable
-5. **Companion Support:** Arrange companion/assistance if needed
-
-## 🚀 Getting Started
-
-1. **Set Environment Variables:**
-   ```bash
-   export SERPAPI_KEY="your-serpapi-key"
-   export AMADEUS_API_KEY="your-amadeus-client-id"
-   export AMADEUS_API_SECRET="your-amadeus-client-secret"
-   export EXCHANGE_RATE_API_KEY="your-exchangerate-api-key"
-   ```
-
-2. **Run the Combined Server:**
-   ```bash
-   python combined_travel_server.py
-   ```
-
-3. **Use the Comprehensive Planning Prompt:**
-   Start with `comprehensive_travel_planning_prompt()` for full dual-platform trip planning assistance.
-
-## 🌟 Best Practices for Dual-Platform Usage
-
-**Flight Search Strategy:**
-1. Start with Google Flights (search_flights_serpapi) for broad market overview
-2. Use Amadeus (search_flights_amadeus) for professional options and detailed fare information
-3. Compare results to find the absolute best deals and options
-
-**Hotel Search Strategy:**
-1. Use Google Hotels (search_hotels_serpapi) for vacation rentals and consumer-friendly options
-2. Use Amadeus hotel searches for professional rates and detailed property information
-3. Cross-reference availability and pricing across both platforms
-
-**Activity Planning Strategy:**
-1. Use Google Events (search_events_serpapi) for local cultural events and festivals
-2. Use Amadeus Activities for professional tours and curated experiences
-3. Combine both for comprehensive activity planning
-
-**Location & Weather Integration:**
-- Always start with geocoding to establish precise coordinates
-- Use weather forecasts to optimize activity and travel planning
-- Calculate distances to optimize daily itineraries
-
-**Financial Planning:**
-- Use currency conversion for accurate international budget planning
-- Track exchange rates for optimal conversion timing
-
-This combined server provides the most comprehensive travel planning capabilities available, leveraging both consumer platforms and professional travel industry systems! 🌎✈️🏨🎭💰"""
+)
 
 
 @mcp.prompt()
-def accessible_trip_planner(
+@_memoized_prompt
+def travel_planning_prompt(
     destination: str,
     departure_location: str = "",
-    duration_days: int = 3,
+    travel_dates: str = "",
     travelers: int = 1,
-    wheelchair_user: bool = False,
-    deaf: bool = False,
-    blind: bool = False,
-    reduced_mobility: bool = False,
-    special_requirements: str = "",
+    budget: str = "",
+    interests: str = "",
+    travel_style: str = "",
 ) -> str:
-    """Generates accessible travel plan with mobility/sensory accommodations and IATA SSR codes."""
-
-    accessibility_needs = []
-    if wheelchair_user:
-        accessibility_needs.append(
-            "wheelchair accessibility (WCHR/WCHS SSR codes, stowage, accessible facilities)"
-        )
-    if deaf:
-        accessibility_needs.append("deaf accessibility (visual alerts, DEAF SSR code)")
-    if blind:
-        accessibility_needs.append(
-            "blind accessibility (audio assistance, BLND SSR code)"
-        )
-    if reduced_mobility:
-        accessibility_needs.append(
-            "reduced mobility support (extra legroom, assistance, accessible entrances)"
-        )
+    """Generates comprehensive travel planning combining flights, hotels, activities, and budget optimization."""
 
-    prompt = f"""♿ **ACCESSIBLE TRAVEL PLANNING ASSISTANT** ♿
+    parts = [
+        f"""🌟 **WELCOME TO YOUR COMBINED TRAVEL CONCIERGE SERVICE** 🌟
 
-You're helping plan an inclusive, accessible trip to {destination}"""
+I'm your comprehensive AI travel specialist with access to BOTH Google Travel Services AND Amadeus Professional Systems! Let me plan your perfect journey to {destination}"""
+    ]
 
     if departure_location:
-        prompt += f" from {departure_location}"
+        parts.append(f" from {departure_location}")
 
-    prompt += f" for {duration_days} days with {travelers} traveler{'s' if travelers != 1 else ''}."
+    if travel_dates:
+        parts.append(f" for {travel_dates}")
 
-    if accessibility_needs:
-        prompt += "\n\n**Accessibility Requirements:**\n"
-        for i, need in enumerate(accessibility_needs, 1):
-            prompt += f"{i}. {need}\n"
+    parts.append(f" for {travelers} traveler{'s' if travelers != 1 else ''}.")
+
+    if budget:
+        parts.append(f"\n💰 **Budget**: {budget}")
+
+    if interests:
+        parts.append(f"\n🎯 **Your Interests**: {interests}")
+
+    if travel_style:
+        parts.append(f"\n✈️ **Travel Style**: {travel_style}")
+
+    parts.append(_TRAVEL_PLANNING_BODY)
+    return "".join(parts)
+
+
+@cache
+def _load_capabilities_doc() -> str:
+    """Read the capabilities reference shipped in the package (once, on first use)."""
+    return (
+        resources.files("travel_assistant")
+        .joinpath("data", "capabilities.md")
+        .read_text(encoding="utf-8")
+    )
+
+
+@mcp.resource("travel://combined/capabilities")
+def combined_travel_server_capabilities() -> str:
+    """Provides comprehensive reference documentation for all travel server capabilities. Returns detailed guide covering dual-platform tools (Google/SerpAPI and Amadeus), features, API requirements, best practices, and integration strategies for flight, hotel, activity, weather, location, and financial planning."""
+
+    return _load_capabilities_doc()
 
-    if special_requirements:
-        prompt += f"\n**Special Requirements:** {special_requirements}\n"
 
-    prompt += """
+# Static body of the accessible trip planner prompt (built once at import)
+_ACCESSIBLE_TRIP_BODY = """
 ## ACCESSIBLE TRIP PLANNING WORKFLOW
 
 ### Phase 1: Flight Search with Accessibility
@@ -1545,30 +1975,63 @@ For Switzerland trips, leverage the specialized accessible ecosystem:
 This plan ensures you can travel with confidence, independence, and dignity!
 """
 
-    return prompt
+
+# Accessibility requirement lines, in the order of accessible_trip_planner's
+# wheelchair_user, deaf, blind and reduced_mobility flags
+_ACCESS_NEEDS = (
+    "wheelchair accessibility (WCHR/WCHS SSR codes, stowage, accessible facilities)",
+    "deaf accessibility (visual alerts, DEAF SSR code)",
+    "blind accessibility (audio assistance, BLND SSR code)",
+    "reduced mobility support (extra legroom, assistance, accessible entrances)",
+)
 
 
 @mcp.prompt()
-def wheelchair_accessible_itinerary(
+@_memoized_prompt
+def accessible_trip_planner(
     destination: str,
+    departure_location: str = "",
     duration_days: int = 3,
-    mobility_level: str = "full_time_wheelchair",
-    companion_available: bool = False,
+    travelers: int = 1,
+    wheelchair_user: bool = False,
+    deaf: bool = False,
+    blind: bool = False,
+    reduced_mobility: bool = False,
+    special_requirements: str = "",
 ) -> str:
-    """Generates barrier-free itinerary optimized for wheelchair users with mobility support."""
+    """Generates accessible travel plan with mobility/sensory accommodations and IATA SSR codes."""
 
-    prompt = f"""♿ **WHEELCHAIR-ACCESSIBLE {duration_days}-DAY ITINERARY FOR {destination.upper()}** ♿
+    flags = (wheelchair_user, deaf, blind, reduced_mobility)
+    accessibility_needs = [text for flag, text in zip(flags, _ACCESS_NEEDS) if flag]
 
-**Mobility Profile:** {mobility_level.replace("_", " ").title()}"""
+    parts = [
+        f"""♿ **ACCESSIBLE TRAVEL PLANNING ASSISTANT** ♿
 
-    if companion_available:
-        prompt += "\n**Companion/Assistant:** Available"
-    else:
-        prompt += (
-            "\n**Companion/Assistant:** Not available - plan for maximum independence"
+You're helping plan an inclusive, accessible trip to {destination}"""
+    ]
+
+    if departure_location:
+        parts.append(f" from {departure_location}")
+
+    parts.append(
+        f" for {duration_days} days with {travelers} traveler{'s' if travelers != 1 else ''}."
+    )
+
+    if accessibility_needs:
+        parts.append("\n\n**Accessibility Requirements:**\n")
+        parts.extend(
+            f"{i}. {need}\n" for i, need in enumerate(accessibility_needs, 1)
         )
 
-    prompt += """
+    if special_requirements:
+        parts.append(f"\n**Special Requirements:** {special_requirements}\n")
+
+    parts.append(_ACCESSIBLE_TRIP_BODY)
+    return "".join(parts)
+
+
+# Static body of the wheelchair itinerary prompt (built once at import)
+_WHEELCHAIR_ITINERARY_BODY = """
 
 ## PRE-TRIP ACCESSIBILITY VERIFICATION
 
@@ -1686,31 +2149,47 @@ Before finalizing any bookings:
 Plan achievable, memorable trips without pushing beyond comfort limits!
 """
 
-    return prompt
-
 
 @mcp.prompt()
-def sensory_accessible_travel(
+@_memoized_prompt
+def wheelchair_accessible_itinerary(
     destination: str,
-    sensory_type: str = "deaf",
     duration_days: int = 3,
-    special_interests: str = "",
+    mobility_level: str = "full_time_wheelchair",
+    companion_available: bool = False,
 ) -> str:
-    """Generates travel plan with visual/audio accommodations for deaf, blind, or deaf-blind travelers."""
+    """Generates barrier-free itinerary optimized for wheelchair users with mobility support."""
 
-    sensory_upper = sensory_type.replace("_", " ").upper()
-    prompt = f"""👁️👂 **SENSORY-ACCESSIBLE TRAVEL PLAN FOR {sensory_upper} TRAVELERS** 👁️👂
+    parts = [
+        f"""♿ **WHEELCHAIR-ACCESSIBLE {duration_days}-DAY ITINERARY FOR {destination.upper()}** ♿
 
-Destination: {destination} | Duration: {duration_days} days"""
+**Mobility Profile:** {mobility_level.replace("_", " ").title()}"""
+    ]
 
-    if special_interests:
-        prompt += f" | Interests: {special_interests}"
+    if companion_available:
+        parts.append("\n**Companion/Assistant:** Available")
+    else:
+        parts.append(
+            "\n**Companion/Assistant:** Not available - plan for maximum independence"
+        )
+
+    parts.append(_WHEELCHAIR_ITINERARY_BODY)
+    return "".join(parts)
 
-    prompt += """
+
+# Sensory travel prompt sections tagged by audience ("all" is always shown)
+_SENSORY_SECTIONS: tuple[tuple[str, str], ...] = (
+    (
+        "all",
+        """
 
 ## FLIGHT ACCESSIBILITY FOR SENSORY NEEDS
 
-### For Deaf Travelers (DEAF SSR Code):
+""",
+    ),
+    (
+        "deaf",
+        """### For Deaf Travelers (DEAF SSR Code):
 1. **Before Flight:**
    - Request DEAF special service code at booking
    - Request interpreter if needed (airline may provide)
@@ -1729,7 +2208,11 @@ Destination: {destination} | Duration: {duration_days} days"""
    - Have written destination address for taxi driver
    - Bring written communication backup
 
-### For Blind Travelers (BLND SSR Code):
+""",
+    ),
+    (
+        "blind",
+        """### For Blind Travelers (BLND SSR Code):
 1. **Before Flight:**
    - Request BLND special service code at booking
    - Request audio description or human assistance
@@ -1749,16 +2232,28 @@ Destination: {destination} | Duration: {duration_days} days"""
    - Reserve extra space for animal
    - Plan relief time at layovers
 
-### For Deaf-Blind Travelers:
+""",
+    ),
+    (
+        "deaf_blind",
+        """### For Deaf-Blind Travelers:
 1. **Request both DEAF and BLND SSR codes**
 2. **Strongly recommend human interpreter/assistant**
 3. **Pre-arrange tactile communication method**
 4. **Bring tactile communication device (Braille, large print)**
 5. **Request private boarding area for orientation**
 
-## HOTEL ACCESSIBILITY FOR SENSORY NEEDS
-
-### Deaf Travelers - Hotel Checklist:
+""",
+    ),
+    (
+        "all",
+        """## HOTEL ACCESSIBILITY FOR SENSORY NEEDS
+
+""",
+    ),
+    (
+        "deaf",
+        """### Deaf Travelers - Hotel Checklist:
 - [ ] Visual doorbell/alert system in room
 - [ ] Caption-enabled TV (confirm availability)
 - [ ] TTY (teletype) phone or video relay service
@@ -1766,7 +2261,11 @@ Destination: {destination} | Duration: {duration_days} days"""
 - [ ] Request written check-in instructions
 - [ ] Written emergency procedures in large print
 
-### Blind Travelers - Hotel Checklist:
+""",
+    ),
+    (
+        "blind",
+        """### Blind Travelers - Hotel Checklist:
 - [ ] Audio description of room layout
 - [ ] Clear room layout with no hazards
 - [ ] Labeled items/buttons in Braille if possible
@@ -1775,7 +2274,11 @@ Destination: {destination} | Duration: {duration_days} days"""
 - [ ] Elevator audio announcements
 - [ ] Tactile information about facilities
 
-### Pre-Arrival Communication:
+""",
+    ),
+    (
+        "all",
+        """### Pre-Arrival Communication:
 - Call hotel 1-2 weeks in advance
 - Explain specific sensory needs
 - Request staff training on accommodation methods
@@ -1783,7 +2286,11 @@ Destination: {destination} | Duration: {duration_days} days"""
 
 ## ACTIVITY & ATTRACTION ACCESSIBILITY
 
-### For Deaf Travelers:
+""",
+    ),
+    (
+        "deaf",
+        """### For Deaf Travelers:
 1. **Museums & Galleries:**
    - Request written descriptions of exhibits
    - Look for captioned video presentations
@@ -1803,7 +2310,11 @@ Destination: {destination} | Duration: {duration_days} days"""
    - Have written menu reviews/descriptions
    - Write questions in advance or use pen/paper
 
-### For Blind Travelers:
+""",
+    ),
+    (
+        "blind",
+        """### For Blind Travelers:
 1. **Museums & Galleries:**
    - Request audio description tours
    - Ask for tactile exhibits to explore
@@ -1831,9 +2342,17 @@ Destination: {destination} | Duration: {duration_days} days"""
    - Public transit with audio announcements
    - Request station attendant assistance
 
-## COMMUNICATION STRATEGIES
-
-### Deaf Travelers:
+""",
+    ),
+    (
+        "all",
+        """## COMMUNICATION STRATEGIES
+
+""",
+    ),
+    (
+        "deaf",
+        """### Deaf Travelers:
 - Carry written destination addresses
 - Use smartphone video relay service for phone calls
 - Pre-write common phrases/questions in destination language
@@ -1841,7 +2360,11 @@ Destination: {destination} | Duration: {duration_days} days"""
 - Use translation apps with visual output
 - Bring notepad for written communication
 
-### Blind Travelers:
+""",
+    ),
+    (
+        "blind",
+        """### Blind Travelers:
 - Bring voice-enabled smartphone with screen reader
 - Use talking GPS/navigation apps
 - Record important information as audio notes
@@ -1849,7 +2372,11 @@ Destination: {destination} | Duration: {duration_days} days"""
 - Use text-to-speech for written information
 - Request verbal assistance from staff/locals
 
-### Both:
+""",
+    ),
+    (
+        "all",
+        """### Both:
 - Carry international accessibility card
 - Have accommodation needs summary in destination language
 - Bring backup communication device
@@ -1893,28 +2420,80 @@ For Switzerland trips, these specialized MCPs support sensory needs:
 - Buffer time before departure
 
 Travel can be rich, meaningful, and fully accessible!
-"""
+""",
+    ),
+)
+
+# Audience tags rendered for each sensory_type; unknown types get everything
+_SENSORY_AUDIENCES = {
+    "deaf": frozenset({"all", "deaf"}),
+    "blind": frozenset({"all", "blind"}),
+    "deaf_blind": frozenset({"all", "deaf", "blind", "deaf_blind"}),
+}
 
-    return prompt
+# Prompt bodies per sensory_type, assembled once at import
+_SENSORY_BODIES = {
+    sensory_type: "".join(
+        text for audience, text in _SENSORY_SECTIONS if audience in audiences
+    )
+    for sensory_type, audiences in _SENSORY_AUDIENCES.items()
+}
 
 
-def main():
-    """Entry point for the Travel Assistant MCP server."""
-    import argparse
+@mcp.prompt()
+@_memoized_prompt
+def sensory_accessible_travel(
+    destination: str,
+    sensory_type: str = "deaf",
+    duration_days: int = 3,
+    special_interests: str = "",
+) -> str:
+    """Generates travel plan with visual/audio accommodations for deaf, blind, or deaf-blind travelers."""
 
+    sensory_upper = sensory_type.replace("_", " ").upper()
+    parts = [
+        f"""👁️👂 **SENSORY-ACCESSIBLE TRAVEL PLAN FOR {sensory_upper} TRAVELERS** 👁️👂
+
+Destination: {destination} | Duration: {duration_days} days"""
+    ]
+
+    if special_interests:
+        parts.append(f" | Interests: {special_interests}")
+
+    parts.append(
+        _SENSORY_BODIES.get(sensory_type.lower(), _SENSORY_BODIES["deaf_blind"])
+    )
+    return "".join(parts)
+
+
+# Command-line defaults, used as-is when the server is started without arguments
+_DEFAULT_ARGS = SimpleNamespace(transport="stdio", port=8000)
+
+
+@lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser (once per process)."""
     parser = argparse.ArgumentParser(description="Travel Assistant MCP Server")
     parser.add_argument(
         "--transport",
         type=str,
         choices=["stdio", "sse", "http"],
-        default="stdio",
+        default=_DEFAULT_ARGS.transport,
         help="Transport type",
     )
     parser.add_argument(
-        "--port", type=int, default=8000, help="Port for HTTP/SSE transport"
+        "--port",
+        type=int,
+        default=_DEFAULT_ARGS.port,
+        help="Port for HTTP/SSE transport",
     )
+    return parser
 
-    args = parser.parse_args()
+
+def main():
+    """Entry point for the Travel Assistant MCP server."""
+    argv = sys.argv[1:]
+    args = _build_parser().parse_args(argv) if argv else _DEFAULT_ARGS
 
     transport_kwargs = {}
     if args.transport in ["sse", "http"]:
@@ -12,6 +12,8 @@ def mock_env_vars(monkeypatch):
     monkeypatch.setenv("AMADEUS_API_KEY", "test-amadeus-key-12345")
     monkeypatch.setenv("AMADEUS_API_SECRET", "test-amadeus-secret-12345")
     monkeypatch.setenv("EXCHANGE_RATE_API_KEY", "test-exchange-key-12345")
+    # Keep tests from writing a geocode cache to the user's home directory
+    monkeypatch.setenv("GEOCODE_CACHE_PATH", "")
 
 
 @pytest.fixture
@@ -1,12 +1,15 @@
 """Tests for travel_assistant.clients module."""
 
 import json
+import re
 from unittest.mock import Mock
 
+import pytest
 import responses
 
 from travel_assistant.clients import (
     AmadeusClientWrapper,
+    AmadeusSessionHTTP,
     ExchangeRateClient,
     GeocodingClient,
     SerpAPIClient,
@@ -26,6 +29,14 @@ class TestSerpAPIClient:
         assert client.base_url == "https://serpapi.com/search"
         assert client.api_key is not None
 
+    def test_serpapi_session_retries_transient_errors(self):
+        """Test that the pooled session retries throttling and 5xx responses."""
+        client = SerpAPIClient()
+        retry = client.session.get_adapter("https://serpapi.com").max_retries
+
+        assert retry.total == 3
+        assert {429, 503} <= set(retry.status_forcelist)
+
     @responses.activate
     def test_search_flights_success(self):
         """Test successful flight search via SerpAPI."""
@@ -53,6 +64,33 @@ class TestSerpAPIClient:
         assert len(result["best_flights"]) == 1
         assert result["best_flights"][0]["price"] == 299
 
+    @responses.activate
+    def test_search_flights_trims_to_max_results(self):
+        """Test that flight lists are trimmed without sending max_results upstream."""
+        mock_response = {
+            "best_flights": [{"price": p} for p in range(5)],
+            "other_flights": [{"price": p} for p in range(8)],
+        }
+
+        responses.add(
+            responses.GET,
+            "https://serpapi.com/search",
+            json=mock_response,
+            status=200,
+        )
+
+        client = SerpAPIClient()
+        result = client.search_flights(
+            max_results=2,
+            departure_id="JFK",
+            arrival_id="LAX",
+            outbound_date="2025-06-15",
+        )
+
+        assert [f["price"] for f in result["best_flights"]] == [0, 1]
+        assert len(result["other_flights"]) == 2
+        assert "max_results" not in responses.calls[0].request.url
+
     @responses.activate
     def test_search_flights_http_500_error(self):
         """Test handling of HTTP 500 error from SerpAPI."""
@@ -368,6 +406,62 @@ class TestAmadeusClientWrapper:
         assert "error" in result
 
 
+class TestAmadeusSessionHTTP:
+    """Test the pooled-session HTTP handler used by the Amadeus SDK."""
+
+    @responses.activate
+    def test_sdk_requests_reuse_cached_token(self):
+        """Test that SDK calls go through the session and reuse one OAuth token."""
+        from amadeus import Client
+
+        responses.add(
+            responses.POST,
+            "https://test.api.amadeus.com/v1/security/oauth2/token",
+            json={"access_token": "token-123", "expires_in": 1799},
+        )
+        responses.add(
+            responses.GET,
+            re.compile(r"https://test\.api\.amadeus\.com/v1/reference-data/.*"),
+            json={"data": [{"hotelId": "PARXYZ"}]},
+            content_type="application/vnd.amadeus+json",
+        )
+
+        client = Client(
+            client_id="id", client_secret="secret", http=AmadeusSessionHTTP()
+        )
+        for _ in range(2):
+            response = client.reference_data.locations.hotels.by_city.get(
+                cityCode="PAR"
+            )
+
+        assert response.result == {"data": [{"hotelId": "PARXYZ"}]}
+        token_calls = [c for c in responses.calls if "oauth2" in c.request.url]
+        assert len(token_calls) == 1
+        last_request = responses.calls[-1].request
+        assert last_request.headers["Authorization"] == "Bearer token-123"
+
+    @responses.activate
+    def test_http_errors_raise_sdk_response_error(self):
+        """Test that HTTP error statuses surface as Amadeus ResponseError."""
+        from amadeus import Client, ResponseError
+
+        responses.add(
+            responses.POST,
+            "https://test.api.amadeus.com/v1/security/oauth2/token",
+            status=401,
+            json={"error": "invalid_client"},
+        )
+
+        client = Client(
+            client_id="id", client_secret="bad", http=AmadeusSessionHTTP()
+        )
+
+        with pytest.raises(ResponseError) as exc:
+            client.reference_data.locations.hotels.by_city.get(cityCode="PAR")
+
+        assert exc.value.response.status_code == 401
+
+
 # =====================================================================
 # EXCHANGE RATE CLIENT TESTS
 # =====================================================================
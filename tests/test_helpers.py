@@ -1,5 +1,7 @@
 """Tests for travel_assistant.helpers module."""
 
+import json
+
 import pytest
 import responses
 
@@ -268,3 +270,496 @@ class TestSecurityHelpers:
         sanitized1 = sanitize_url_for_logging(url1)
         assert "abc123def456" not in sanitized1
         assert "[REDACTED]" in sanitized1
+
+
+class TestSessionHelpers:
+    """Test HTTP session helpers."""
+
+    def test_create_pooled_session_mounts_adapter(self):
+        """Test that the pooled adapter is mounted for HTTP and HTTPS."""
+        import requests
+
+        from travel_assistant.helpers import create_pooled_session
+
+        session = create_pooled_session(pool_connections=4, pool_maxsize=8)
+
+        assert isinstance(session, requests.Session)
+        adapter = session.get_adapter("https://serpapi.com/search")
+        assert adapter is session.get_adapter("http://example.com")
+        assert adapter._pool_connections == 4
+        assert adapter._pool_maxsize == 8
+
+    def test_create_pooled_session_accepts_all_decodable_encodings(self):
+        """Test that pooled sessions advertise every supported compression."""
+        from urllib3.util.request import ACCEPT_ENCODING
+
+        from travel_assistant.helpers import create_pooled_session
+
+        session = create_pooled_session()
+
+        assert session.headers["Accept-Encoding"] == ACCEPT_ENCODING
+        assert "gzip" in session.headers["Accept-Encoding"]
+
+    def test_exchange_rate_session_is_shared(self):
+        """Test that the ExchangeRate-API session is created once and retries."""
+        from travel_assistant.helpers import get_exchange_rate_session
+
+        session = get_exchange_rate_session()
+
+        assert session is get_exchange_rate_session()
+        adapter = session.get_adapter("https://v6.exchangerate-api.com/v6")
+        assert adapter.max_retries.total == 2
+
+
+class TestLoggingHelpers:
+    """Test logging-related helper functions."""
+
+    def test_lazy_json_serializes_on_str(self):
+        """Test that LazyJSON renders its payload as JSON."""
+        from travel_assistant.helpers import LazyJSON
+
+        lazy = LazyJSON({"cityCode": "PAR", "radius": 5})
+
+        assert json.loads(str(lazy)) == {"cityCode": "PAR", "radius": 5}
+
+    def test_json_helpers_round_trip(self):
+        """Test dumps_json/loads_json round trip, including non-JSON values."""
+        from datetime import date
+
+        from travel_assistant.helpers import dumps_json, loads_json
+
+        payload = {"data": [{"id": "1", "price": 99.5}], "when": date(2025, 6, 15)}
+
+        encoded = dumps_json(payload)
+
+        assert isinstance(encoded, str)
+        assert loads_json(encoded) == {
+            "data": [{"id": "1", "price": 99.5}],
+            "when": "2025-06-15",
+        }
+
+    def test_json_helpers_fall_back_to_stdlib(self, monkeypatch):
+        """Test that JSON helpers work when orjson is not installed."""
+        from travel_assistant import helpers
+
+        monkeypatch.setattr(helpers, "orjson", None)
+
+        assert helpers.loads_json(helpers.dumps_json({"a": [1, 2]})) == {"a": [1, 2]}
+
+    def test_lazy_json_defers_serialization(self):
+        """Test that LazyJSON does not serialize until formatted."""
+        from travel_assistant.helpers import LazyJSON
+
+        calls = []
+
+        class Tracked:
+            def __str__(self):
+                calls.append(1)
+                return "tracked"
+
+        lazy = LazyJSON({"value": Tracked()})
+        assert calls == []
+
+        assert json.loads(str(lazy)) == {"value": "tracked"}
+        assert calls == [1]
+
+
+class TestFlightEmissionsHelpers:
+    """Test flight emissions extraction helpers."""
+
+    def test_extract_flight_emissions_reshapes_data(self):
+        """Test that carbon emissions are renamed and annotated."""
+        from travel_assistant.helpers import extract_flight_emissions
+
+        flights = [
+            {
+                "price": 420,
+                "carbon_emissions": {
+                    "this_flight": 150000,
+                    "typical_for_this_route": 170000,
+                    "difference_percent": -12,
+                },
+            },
+            {"price": 380},
+        ]
+
+        result = extract_flight_emissions(flights)
+
+        assert result[0]["carbon_emissions"]["this_flight_grams"] == 150000
+        assert result[0]["carbon_emissions"]["typical_for_route_grams"] == 170000
+        assert result[0]["carbon_emissions"]["difference_percent"] == -12
+        assert "note" in result[0]["carbon_emissions"]
+        assert result[1] == {"price": 380}
+
+    def test_extract_flight_emissions_does_not_mutate_input(self):
+        """Test that the source flight dicts are left untouched."""
+        from travel_assistant.helpers import extract_flight_emissions
+
+        flight = {"carbon_emissions": {"this_flight": 1}}
+
+        extract_flight_emissions([flight])
+
+        assert flight == {"carbon_emissions": {"this_flight": 1}}
+
+    def test_extract_flight_emissions_passes_through_flights_without_data(self):
+        """Test that flights without emissions are returned as-is, not copied."""
+        from travel_assistant.helpers import extract_flight_emissions
+
+        flight = {"price": 120}
+
+        assert extract_flight_emissions([flight])[0] is flight
+
+    def test_extract_flight_emissions_handles_partial_data(self):
+        """Test that missing emissions fields are reported as None."""
+        from travel_assistant.helpers import extract_flight_emissions
+
+        result = extract_flight_emissions([{"carbon_emissions": {"this_flight": 9}}])
+
+        emissions = result[0]["carbon_emissions"]
+        assert emissions["this_flight_grams"] == 9
+        assert emissions["typical_for_route_grams"] is None
+        assert emissions["difference_percent"] is None
+
+    def test_summarize_co2_emissions(self):
+        """Test per-cabin and per-passenger CO2 aggregation."""
+        from travel_assistant.helpers import summarize_co2_emissions
+
+        summary = summarize_co2_emissions(
+            [
+                {"weight": 120, "cabin": "ECONOMY"},
+                {"weight": 30},
+            ],
+            inv_adults=0.5,
+        )
+
+        assert summary["total_weight_kg"] == 150
+        assert summary["unit"] == "kilograms"
+        assert summary["emissions_by_cabin"][0] == {
+            "cabin": "ECONOMY",
+            "weight_kg": 120,
+            "per_passenger_kg": 60.0,
+        }
+        assert summary["emissions_by_cabin"][1]["cabin"] == "UNKNOWN"
+        assert summary["emissions_by_cabin"][1]["per_passenger_kg"] == 15.0
+
+
+class TestTTLCache:
+    """Test the TTLCache helper."""
+
+    def test_get_returns_stored_value(self):
+        """Test basic set/get round trip."""
+        from travel_assistant.helpers import TTLCache
+
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set(("a", 1), {"x": 1})
+
+        assert cache.get(("a", 1)) == {"x": 1}
+        assert cache.get("missing") is None
+
+    def test_entries_expire(self, monkeypatch):
+        """Test that entries older than the TTL are dropped."""
+        from travel_assistant import helpers
+
+        now = [1000.0]
+        monkeypatch.setattr(helpers.time, "monotonic", lambda: now[0])
+
+        cache = helpers.TTLCache(maxsize=2, ttl=10)
+        cache.set("key", "value")
+        now[0] += 10
+
+        assert cache.get("key") is None
+        assert len(cache) == 0
+
+    def test_per_entry_ttl_overrides_default(self, monkeypatch):
+        """Test that set(ttl=...) controls how long that entry lives."""
+        from travel_assistant import helpers
+
+        now = [1000.0]
+        monkeypatch.setattr(helpers.time, "monotonic", lambda: now[0])
+
+        cache = helpers.TTLCache(maxsize=4, ttl=100)
+        cache.set("short", 1, ttl=10)
+        cache.set("long", 2, ttl=1000)
+        now[0] += 500
+
+        assert cache.get("short") is None
+        assert cache.get("long") == 2
+
+    def test_max_age_requires_fresher_entry(self, monkeypatch):
+        """Test that max_age rejects stale entries without evicting them."""
+        from travel_assistant import helpers
+
+        now = [1000.0]
+        monkeypatch.setattr(helpers.time, "monotonic", lambda: now[0])
+
+        cache = helpers.TTLCache(maxsize=2, ttl=300)
+        cache.set("USD/EUR", 0.92)
+        now[0] += 60
+
+        assert cache.get("USD/EUR", max_age=30) is None
+        assert cache.get("USD/EUR") == 0.92
+
+    def test_evicts_least_recently_used(self):
+        """Test that the least recently used entry is evicted when full."""
+        from travel_assistant.helpers import TTLCache
+
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+
+class TestPersistentCache:
+    """Test the SQLite-backed PersistentCache helper."""
+
+    def test_round_trip_survives_reopen(self, tmp_path):
+        """Test that values persist across cache instances."""
+        from travel_assistant.helpers import PersistentCache
+
+        path = str(tmp_path / "geocode.sqlite3")
+        PersistentCache(path).set("paris", {"latitude": 48.85}, ttl=60)
+
+        assert PersistentCache(path).get("paris") == {"latitude": 48.85}
+
+    def test_expired_entries_are_ignored(self, tmp_path, monkeypatch):
+        """Test that entries past their TTL are treated as misses."""
+        from travel_assistant import helpers
+
+        now = [1000.0]
+        monkeypatch.setattr(helpers.time, "time", lambda: now[0])
+
+        cache = helpers.PersistentCache(str(tmp_path / "cache.sqlite3"))
+        cache.set("nowhere", {"error": "not found"}, ttl=3600)
+        now[0] += 3600
+
+        assert cache.get("nowhere") is None
+
+    def test_geocode_cache_key_normalizes_location(self):
+        """Test that case and surrounding whitespace do not affect the key."""
+        from travel_assistant.helpers import make_geocode_cache_key
+
+        key = make_geocode_cache_key(" Paris ", "en", None, True, True)
+
+        assert key == make_geocode_cache_key("paris", "en", None, True, True)
+        assert key != make_geocode_cache_key("paris", "fr", None, True, True)
+
+    def test_geocode_cache_key_normalizes_spacing_and_country_codes(self):
+        """Test that inner whitespace and country-code order share one key."""
+        from travel_assistant.helpers import make_geocode_cache_key
+
+        key = make_geocode_cache_key("Paris,  FR", "en", "fr, be", True, True)
+
+        assert key == make_geocode_cache_key("paris, fr", "en", "BE,FR", True, True)
+        assert key == make_geocode_cache_key("Paris FR.", "en", "fr,be", True, True)
+        assert len(key) == 32
+
+
+class TestDistanceHelpers:
+    """Test great-circle distance helpers."""
+
+    def test_haversine_km_matches_geodesic_closely(self):
+        """Test haversine stays within 0.5% of the geopy geodesic."""
+        from geopy.distance import geodesic
+
+        from travel_assistant.helpers import haversine_km
+
+        paris, new_york = (48.8566, 2.3522), (40.7128, -74.0060)
+
+        approx = haversine_km(*paris, *new_york)
+        exact = geodesic(paris, new_york).kilometers
+
+        assert abs(approx - exact) / exact < 0.005
+
+    def test_haversine_km_zero_for_same_point(self):
+        """Test that identical points are zero distance apart."""
+        from travel_assistant.helpers import haversine_km
+
+        assert haversine_km(47.37, 8.54, 47.37, 8.54) == 0.0
+
+
+class TestTTLCachedDecorator:
+    """Test the ttl_cached decorator."""
+
+    def test_identical_params_hit_cache(self):
+        """Test that equal params (in any order) reuse the cached result."""
+        from travel_assistant.helpers import ttl_cached
+
+        calls = []
+
+        @ttl_cached(ttl=60, maxsize=8)
+        def fetch(params, client):
+            calls.append(params)
+            return {"data": [params["q"]]}
+
+        first = fetch({"q": "Paris", "gl": "us"}, object())
+        second = fetch({"gl": "us", "q": "Paris"}, object())
+
+        assert first == second == {"data": ["Paris"]}
+        assert len(calls) == 1
+
+    def test_force_refresh_and_errors_bypass_cache(self):
+        """Test that force_refresh refetches and error results are not stored."""
+        from travel_assistant.helpers import ttl_cached
+
+        results = iter([{"error": "rate limited"}, {"data": 1}, {"data": 2}])
+
+        @ttl_cached(ttl=60, maxsize=8)
+        def fetch(params):
+            return next(results)
+
+        assert fetch({"q": "x"}) == {"error": "rate limited"}
+        assert fetch({"q": "x"}) == {"data": 1}
+        assert fetch({"q": "x"}) == {"data": 1}
+        assert fetch({"q": "x"}, force_refresh=True) == {"data": 2}
+
+    def test_concurrent_misses_share_one_upstream_call(self):
+        """Test that simultaneous identical calls are coalesced into one fetch."""
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        from travel_assistant.helpers import ttl_cached
+
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        @ttl_cached(ttl=60, maxsize=8)
+        def fetch(params):
+            calls.append(params)
+            started.set()
+            release.wait(timeout=5)
+            return {"data": params["q"]}
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            first = pool.submit(fetch, {"q": "Rome"})
+            started.wait(timeout=5)
+            second = pool.submit(fetch, {"q": "Rome"})
+            release.set()
+
+            assert first.result() == second.result() == {"data": "Rome"}
+        assert len(calls) == 1
+
+    def test_params_cache_key_handles_lists_and_nested_values(self):
+        """Test that list values key as tuples and unhashable values still key."""
+        from travel_assistant.helpers import make_params_cache_key
+
+        key = make_params_cache_key({"b": [1, 2], "a": "x"})
+
+        assert key == (("a", str, "x"), ("b", list, ((int, 1), (int, 2))))
+        assert make_params_cache_key({"a": "x", "b": [1, 2]}) == key
+        nested = make_params_cache_key({"a": {"b": 1}})
+        assert nested == make_params_cache_key({"a": {"b": 1}})
+
+    def test_params_cache_key_distinguishes_equal_values_of_other_types(self):
+        """Test that 1, 1.0 and True (alone or in lists) key separately."""
+        from travel_assistant.helpers import make_params_cache_key
+
+        keys = {
+            make_params_cache_key({"a": value})
+            for value in (1, 1.0, True, [1], [True])
+        }
+
+        assert len(keys) == 5
+
+
+class TestRetryTransient:
+    """Test the retry_transient decorator."""
+
+    def test_retries_transient_errors_then_succeeds(self, monkeypatch):
+        """Test that transient failures are retried with backoff."""
+        from travel_assistant import helpers
+
+        sleeps = []
+        monkeypatch.setattr(helpers.time, "sleep", sleeps.append)
+        outcomes = iter([ConnectionError(), ConnectionError(), "ok"])
+
+        @helpers.retry_transient(lambda e: isinstance(e, ConnectionError))
+        def call():
+            outcome = next(outcomes)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        assert call() == "ok"
+        assert len(sleeps) == 2
+        assert sleeps[1] > sleeps[0]
+
+    def test_permanent_errors_are_not_retried(self, monkeypatch):
+        """Test that errors the predicate rejects propagate immediately."""
+        from travel_assistant import helpers
+
+        monkeypatch.setattr(helpers.time, "sleep", lambda _: None)
+        calls = []
+
+        @helpers.retry_transient(lambda e: isinstance(e, ConnectionError))
+        def call():
+            calls.append(1)
+            raise ValueError("bad request")
+
+        with pytest.raises(ValueError):
+            call()
+        assert len(calls) == 1
+
+
+class TestParamHelpers:
+    """Test request parameter helpers."""
+
+    def test_build_csv_params_joins_and_skips_empty(self):
+        """Test that lists are comma-joined and empty/None fields dropped."""
+        from travel_assistant.helpers import build_csv_params
+
+        result = build_csv_params(
+            {"hotel_class": [4, 5], "amenities": [], "brands": None, "ages": [7]}
+        )
+
+        assert result == {"hotel_class": "4,5", "ages": "7"}
+
+    def test_build_optional_params_returns_fresh_copies(self):
+        """Test that memoized results are copied so callers can mutate them."""
+        from travel_assistant.helpers import build_optional_params
+
+        first = build_optional_params({"cityCode": "PAR"}, {"radius": 0}, {"radius"})
+        first["extra"] = True
+        second = build_optional_params({"cityCode": "PAR"}, {"radius": 0}, {"radius"})
+
+        assert second == {"cityCode": "PAR", "radius": 0}
+
+    def test_build_optional_params_keeps_value_types(self):
+        """Test that memoization does not conflate 1 with True or 1.0."""
+        from travel_assistant.helpers import build_optional_params
+
+        build_optional_params({"nonStop": 1}, {"max": True}, {"max"})
+        result = build_optional_params({"nonStop": True}, {"max": 1.0}, {"max"})
+
+        assert result["nonStop"] is True
+        assert type(result["max"]) is float
+
+    def test_build_optional_params_unhashable_values(self):
+        """Test that unhashable values bypass the memo cache."""
+        from travel_assistant.helpers import build_optional_params
+
+        result = build_optional_params({"ids": ["A", "B"]}, {"tags": ["x"], "q": ""})
+
+        assert result == {"ids": ["A", "B"], "tags": ["x"]}
+
+
+class TestTimestampHelpers:
+    """Test the cached timestamp helper."""
+
+    def test_now_iso_reused_within_second(self, monkeypatch):
+        """Test that the ISO string is rendered once per wall-clock second."""
+        from datetime import datetime
+
+        from travel_assistant import helpers
+
+        monkeypatch.setattr(helpers.time, "time", lambda: 1_700_000_000.25)
+        first = helpers.now_iso()
+        monkeypatch.setattr(helpers.time, "time", lambda: 1_700_000_000.75)
+
+        assert helpers.now_iso() is first
+        assert first == datetime.fromtimestamp(1_700_000_000).isoformat()
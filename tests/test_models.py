@@ -9,6 +9,7 @@ from travel_assistant.models import (
     AmadeusEmissions,
     AmadeusFlightSearchParams,
     AmadeusHotelOfferParams,
+    AmadeusPassengerCounts,
     APIResponse,
     CurrencyConversion,
     CurrencyParams,
@@ -185,6 +186,25 @@ class TestAmadeusFlightSearchParams:
         assert params.maxPrice == 1500
 
 
+class TestAmadeusPassengerCounts:
+    """Test AmadeusPassengerCounts cross-field validation."""
+
+    def test_valid_passenger_counts(self):
+        """Test that counts within GDS limits are accepted."""
+        counts = AmadeusPassengerCounts(adults=2, children=3, infants=2)
+        assert counts.adults == 2
+
+    def test_seated_travelers_limit(self):
+        """Test adults plus children cannot exceed 9."""
+        with pytest.raises(ValidationError, match="cannot exceed 9"):
+            AmadeusPassengerCounts(adults=5, children=5)
+
+    def test_infants_cannot_exceed_adults(self):
+        """Test each infant needs an accompanying adult."""
+        with pytest.raises(ValidationError, match="cannot exceed number of adults"):
+            AmadeusPassengerCounts(adults=1, infants=2)
+
+
 class TestHotelSearchParams:
     """Test HotelSearchParams Pydantic model."""
 
@@ -1,5 +1,11 @@
 """Tests for travel_assistant.server module."""
 
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+import responses
+
 from travel_assistant.server import mcp
 
 
@@ -76,6 +82,29 @@ class TestServerConfiguration:
         name = getattr(mcp, "name", None) or getattr(mcp, "_name", "travel-server")
         assert isinstance(name, str) and len(name) > 0
 
+    def test_main_uses_defaults_without_arguments(self, monkeypatch):
+        """Test that main() skips argument parsing when no arguments are given."""
+        from travel_assistant import server
+
+        calls = []
+        monkeypatch.setattr(server.sys, "argv", ["travel-assistant"])
+        monkeypatch.setattr(server.mcp, "run", lambda **kw: calls.append(kw))
+        server.main()
+
+        assert calls == [{"transport": "stdio", "show_banner": True}]
+
+    def test_main_parses_http_port(self, monkeypatch):
+        """Test that main() forwards the port for HTTP transport."""
+        from travel_assistant import server
+
+        calls = []
+        argv = ["travel-assistant", "--transport", "http", "--port", "9000"]
+        monkeypatch.setattr(server.sys, "argv", argv)
+        monkeypatch.setattr(server.mcp, "run", lambda **kw: calls.append(kw))
+        server.main()
+
+        assert calls == [{"transport": "http", "show_banner": True, "port": 9000}]
+
 
 class TestServerImport:
     """Test server import and instantiation."""
@@ -151,6 +180,46 @@ class TestClientIntegration:
         assert client is not None
         assert client.api_key is not None
 
+    def test_serpapi_client_built_once_on_demand(self):
+        """Test that the server reuses a single lazily built SerpAPI client."""
+        from travel_assistant import server
+
+        assert server._get_serpapi_client() is server._get_serpapi_client()
+
+    def test_serpapi_client_built_once_under_concurrency(self, monkeypatch):
+        """Test that parallel first calls from worker threads share one client."""
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+
+        from travel_assistant import server
+
+        built = []
+
+        def slow_client():
+            time.sleep(0.01)
+            built.append(object())
+            return built[-1]
+
+        monkeypatch.setattr(server, "_SERPAPI_CLIENT", None)
+        monkeypatch.setattr(server, "SerpAPIClient", slow_client)
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            clients = list(pool.map(lambda _: server._get_serpapi_client(), range(8)))
+
+        assert len(built) == 1
+        assert all(client is built[0] for client in clients)
+
+    def test_amadeus_client_none_without_credentials(self, monkeypatch):
+        """Test that the lazy Amadeus getter yields None without credentials."""
+        from travel_assistant import server
+
+        monkeypatch.delenv("AMADEUS_API_KEY", raising=False)
+        monkeypatch.delenv("AMADEUS_API_SECRET", raising=False)
+        server._get_amadeus_client.cache_clear()
+        try:
+            assert server._get_amadeus_client() is None
+        finally:
+            server._get_amadeus_client.cache_clear()
+
     def test_exchange_rate_client_creatable(self):
         """Test that ExchangeRate client can be instantiated."""
         from travel_assistant.clients import ExchangeRateClient
@@ -165,3 +234,548 @@ class TestClientIntegration:
 
         client = GeocodingClient()
         assert client is not None
+
+
+class TestHealthCheck:
+    """Test the /health custom route."""
+
+    async def test_health_check_returns_json_response(self):
+        """Test that the health check serves a valid JSON payload."""
+        import json
+
+        from travel_assistant.server import health_check
+
+        response = await health_check(None)
+
+        assert response.media_type == "application/json"
+        payload = json.loads(response.body)
+        assert payload["status"] == "healthy"
+        assert payload["service"] == "Travel Concierge"
+        assert payload["timestamp"]
+
+    def test_health_body_reused_within_a_second(self, monkeypatch):
+        """Test that probes sharing a timestamp get the same rendered bytes."""
+        from travel_assistant import server
+
+        monkeypatch.setattr(server, "now_iso", lambda: "2026-01-01T00:00:00")
+
+        assert server._health_body() is server._health_body()
+
+
+class TestExchangeRateCache:
+    """Test exchange-rate caching and revalidation in the server."""
+
+    @responses.activate
+    def test_stale_rates_revalidated_with_etag(self):
+        """Test that a stale rate table is revalidated and a 304 reuses it."""
+        from travel_assistant import server
+
+        server._FX_RATE_CACHE.clear()
+        server._FX_VALIDATORS.clear()
+        url = "https://v6.exchangerate-api.com/v6/test-exchange-key-12345/latest/USD"
+        responses.add(
+            responses.GET,
+            url,
+            json={"result": "success", "conversion_rates": {"EUR": 0.92}},
+            headers={"ETag": '"rates-v1"'},
+        )
+        responses.add(responses.GET, url, status=304)
+
+        assert server._get_rate("USD", "EUR") == 0.92
+        assert server._get_rate("USD", "EUR") == 0.92
+        assert len(responses.calls) == 1
+
+        server._FX_RATE_CACHE.clear()
+        assert server._get_rate("USD", "EUR") == 0.92
+        assert len(responses.calls) == 2
+        assert responses.calls[1].request.headers["If-None-Match"] == '"rates-v1"'
+
+    @responses.activate
+    def test_reverse_pair_served_from_cached_table(self):
+        """Test that a cached EUR table answers USD->EUR without a request."""
+        from travel_assistant import server
+
+        server._FX_RATE_CACHE.clear()
+        server._FX_RATE_CACHE.set("EUR", {"USD": 1.25})
+
+        assert server._get_rate("USD", "EUR") == 0.8
+        assert len(responses.calls) == 0
+
+    @responses.activate
+    def test_cross_rate_served_from_pivot_table(self):
+        """Test that a cached USD table prices EUR->GBP without a request."""
+        from travel_assistant import server
+
+        server._FX_RATE_CACHE.clear()
+        server._FX_RATE_CACHE.set("USD", {"EUR": 0.5, "GBP": 0.25})
+
+        assert server._get_rate("EUR", "GBP") == 0.5
+        assert len(responses.calls) == 0
+
+    @responses.activate
+    async def test_convert_currency_multi_uses_one_fetch(self):
+        """Test that several targets are converted from a single rate table."""
+        from travel_assistant import server
+
+        server._FX_RATE_CACHE.clear()
+        server._FX_VALIDATORS.clear()
+        responses.add(
+            responses.GET,
+            "https://v6.exchangerate-api.com/v6/test-exchange-key-12345/latest/USD",
+            json={
+                "result": "success",
+                "conversion_rates": {"EUR": 0.5, "GBP": 0.25},
+            },
+        )
+
+        result = await server.convert_currency_multi.fn(
+            "usd", ["eur", "GBP", "XYZ"], amount=10
+        )
+
+        assert result["conversions"]["EUR"]["converted_amount"] == 5.0
+        assert result["conversions"]["GBP"]["converted_amount"] == 2.5
+        assert result["unsupported_currencies"] == ["XYZ"]
+        assert len(responses.calls) == 1
+
+
+class TestAmadeusResultLimits:
+    """Test trimming of Amadeus result lists."""
+
+    def test_limit_trims_without_touching_cached_body(self):
+        """Test that limiting returns a copy and leaves the original list intact."""
+        from travel_assistant.server import _limit_amadeus_data
+
+        body = {"data": [{"id": 1}, {"id": 2}, {"id": 3}], "meta": {"count": 3}}
+
+        limited = _limit_amadeus_data(body, 2)
+
+        assert limited["data"] == [{"id": 1}, {"id": 2}]
+        assert limited["meta"] == {"count": 3}
+        assert len(body["data"]) == 3
+        assert _limit_amadeus_data(body, None) is body
+
+
+
+class TestAmadeusToolWrapper:
+    """Test the shared amadeus_tool decorator."""
+
+    async def test_validation_errors_are_not_wrapped(self):
+        """Test that tool-level error dicts skip Amadeus response formatting."""
+        from travel_assistant import server
+
+        result = await server.search_hotel_offers_amadeus.fn(
+            checkInDate="2030-01-01", checkOutDate="2030-01-02", ctx=None
+        )
+
+        assert result == {"error": "Either cityCode or hotelIds must be provided"}
+
+@pytest.fixture
+def fake_nominatim(monkeypatch):
+    """Point geocode_location at a fake Nominatim with the SQLite cache disabled.
+
+    Returns a configurator taking the match coordinates, its ``raw`` payload
+    (or ``found=False`` for no match) and a per-call I/O ``delay``; it returns
+    the recorded geocoder calls and the functions sent through ``_run_io``.
+    In-flight lookups and the memory cache are cleared on teardown.
+    """
+    from travel_assistant import server
+
+    server._GEOCODE_MEMORY_CACHE.clear()
+    monkeypatch.setattr(server, "get_geocode_cache", lambda: None)
+
+    def configure(latitude=1.0, longitude=2.0, raw=None, delay=0.0, found=True):
+        calls = []
+        offloaded = []
+
+        def fake_geocode(location, **kwargs):
+            calls.append(location)
+            if not found:
+                return None
+            return SimpleNamespace(
+                latitude=latitude, longitude=longitude, address="A", raw=raw or {}
+            )
+
+        async def fake_run_io(ctx, fn, *args, **kwargs):
+            offloaded.append(fn)
+            if delay:
+                await asyncio.sleep(delay)
+            return fn(*args, **kwargs)
+
+        monkeypatch.setattr(server, "get_geolocator", lambda: (fake_geocode, None))
+        monkeypatch.setattr(server, "_run_io", fake_run_io)
+        return SimpleNamespace(calls=calls, offloaded=offloaded, geocode=fake_geocode)
+
+    yield configure
+    server._GEOCODE_INFLIGHT.clear()
+    server._GEOCODE_MEMORY_CACHE.clear()
+
+
+class TestGeocodeBatch:
+    """Test batch geocoding."""
+
+    async def test_batch_dedupes_and_preserves_order(self, monkeypatch):
+        """Test that repeated locations are geocoded once and results keep input order."""
+        from travel_assistant import server
+
+        calls = []
+
+        async def fake_geocode(location, **kwargs):
+            calls.append(location)
+            return {"location": location}
+
+        monkeypatch.setattr(server.geocode_location, "fn", fake_geocode)
+
+        result = await server.geocode_locations_batch.fn(
+            ["Paris", "Rome", "Paris"], ctx=None
+        )
+
+        assert [r["location"] for r in result["results"]] == ["Paris", "Rome", "Paris"]
+        assert sorted(calls) == ["Paris", "Rome"]
+
+    async def test_repeat_lookup_served_from_memory(self, fake_nominatim, monkeypatch):
+        """Test that a repeat query is answered from memory with its own echo fields."""
+        from travel_assistant import server
+
+        nominatim = fake_nominatim(latitude=38.72, longitude=-9.14)
+
+        first = await server.geocode_location.fn("Lisbon", ctx=None)
+        monkeypatch.setattr(server, "now_iso", lambda: "2030-01-01T00:00:00")
+        second = await server.geocode_location.fn("  lisbon ", ctx=None)
+
+        assert first["coordinates"] == {"latitude": 38.72, "longitude": -9.14}
+        assert second["coordinates"] == first["coordinates"]
+        assert second["location"] == "  lisbon "
+        assert second["search_timestamp"] == "2030-01-01T00:00:00"
+        assert nominatim.calls == ["Lisbon"]
+
+    async def test_cached_not_found_names_the_current_query(self, fake_nominatim):
+        """Test that a cached miss quotes the later caller's own spelling."""
+        from travel_assistant import server
+
+        nominatim = fake_nominatim(found=False)
+
+        await server.geocode_location.fn("St Louis", ctx=None)
+        result = await server.geocode_location.fn("st. louis", ctx=None)
+
+        assert result["error"] == "Location 'st. louis' not found"
+        assert nominatim.calls == ["St Louis"]
+
+    async def test_concurrent_identical_lookups_share_one_request(
+        self, fake_nominatim
+    ):
+        """Test that parallel queries for one place reach Nominatim once."""
+        from travel_assistant import server
+
+        nominatim = fake_nominatim(delay=0.01)
+
+        first, second = await asyncio.gather(
+            server.geocode_location.fn("Zurich", ctx=None),
+            server.geocode_location.fn("zurich", ctx=None),
+        )
+
+        assert first["coordinates"] == second["coordinates"]
+        assert [first["location"], second["location"]] == ["Zurich", "zurich"]
+        assert nominatim.calls == ["Zurich"]
+        assert server._GEOCODE_INFLIGHT == {}
+
+    async def test_cancelled_caller_does_not_cancel_shared_lookup(
+        self, fake_nominatim
+    ):
+        """Test that cancelling the first caller still lets the second finish."""
+        from travel_assistant import server
+
+        fake_nominatim(latitude=3.0, longitude=4.0, delay=0.02)
+
+        first = asyncio.ensure_future(server.geocode_location.fn("Geneva", ctx=None))
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(server.geocode_location.fn("geneva", ctx=None))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        result = await second
+
+        assert first.cancelled()
+        assert result["coordinates"] == {"latitude": 3.0, "longitude": 4.0}
+        assert server._GEOCODE_INFLIGHT == {}
+
+    async def test_raw_data_trimmed_unless_requested(self, fake_nominatim):
+        """Test that only key Nominatim fields are returned by default."""
+        from travel_assistant import server
+
+        raw = {"osm_id": 1, "type": "city", "licence": "ODbL", "boundingbox": [0]}
+        fake_nominatim(raw=raw)
+
+        trimmed = await server.geocode_location.fn("Bern", ctx=None)
+        full = await server.geocode_location.fn("Bern", ctx=None, include_raw=True)
+
+        assert trimmed["raw_data"] == {"osm_id": 1, "type": "city"}
+        assert full["raw_data"] == raw
+
+    async def test_persistent_cache_io_runs_off_the_event_loop(
+        self, fake_nominatim, monkeypatch
+    ):
+        """Test that SQLite cache reads and writes go through the I/O pool."""
+        from travel_assistant import server
+
+        nominatim = fake_nominatim()
+        stored = {}
+        cache = SimpleNamespace(
+            get=lambda key: stored.get(key),
+            set=lambda key, value, ttl: stored.__setitem__(key, value),
+        )
+        monkeypatch.setattr(server, "get_geocode_cache", lambda: cache)
+
+        await server.geocode_location.fn("Basel", ctx=None)
+
+        assert nominatim.offloaded == [cache.get, nominatim.geocode, cache.set]
+        assert len(stored) == 1
+
+    async def test_batch_rejects_oversized_lists(self):
+        """Test that batches above the limit are rejected."""
+        from travel_assistant import server
+
+        result = await server.geocode_locations_batch.fn(["x"] * 51, ctx=None)
+
+        assert "error" in result
+
+
+class TestCalculateDistance:
+    """Test the calculate_distance tool."""
+
+    def test_near_identical_points_short_circuit(self):
+        """Test that points within float noise of each other are 0 km apart."""
+        from travel_assistant.server import calculate_distance
+
+        result = calculate_distance.fn(48.8566, 2.3522, 48.856600001, 2.3522, "miles")
+
+        assert result["distance"] == {"value": 0.0, "unit": "miles"}
+        assert result["all_units"]["kilometers"] == 0.0
+
+    def test_distance_matrix_is_symmetric_and_matches_pairwise(self):
+        """Test that the matrix agrees with calculate_distance for each pair."""
+        from travel_assistant.server import calculate_distance, calculate_distance_matrix
+
+        points = [(48.8566, 2.3522), (51.5074, -0.1278), (41.9028, 12.4964)]
+
+        result = calculate_distance_matrix.fn(points, unit="miles")
+
+        distances = result["distances"]
+        assert [distances[i][i] for i in range(3)] == [0.0, 0.0, 0.0]
+        assert distances[0][1] == distances[1][0]
+        pairwise = calculate_distance.fn(*points[0], *points[2], unit="miles")
+        assert distances[0][2] == pairwise["distance"]["value"]
+
+
+class TestPromptCaching:
+    """Test memoization of rendered prompts."""
+
+    def test_identical_prompt_requests_hit_cache(self):
+        """Test that repeated identical prompt arguments reuse the rendered text."""
+        from travel_assistant.server import sensory_accessible_travel
+
+        render = sensory_accessible_travel.fn
+        render.cache_clear()
+
+        first = render(destination="Lisbon", sensory_type="blind")
+        second = render(destination="Lisbon", sensory_type="blind")
+
+        assert first is second
+        assert render.cache_info().hits == 1
+
+    def test_sensory_prompt_renders_only_relevant_sections(self):
+        """Test that deaf travelers get deaf sections and deaf-blind gets both."""
+        from travel_assistant.server import sensory_accessible_travel
+
+        deaf = sensory_accessible_travel.fn(destination="Bern", sensory_type="deaf")
+        both = sensory_accessible_travel.fn(
+            destination="Bern", sensory_type="deaf_blind"
+        )
+
+        assert "For Deaf Travelers (DEAF SSR Code)" in deaf
+        assert "For Blind Travelers (BLND SSR Code)" not in deaf
+        assert "For Blind Travelers (BLND SSR Code)" in both
+        assert "For Deaf-Blind Travelers" in both
+
+
+class TestCapabilitiesResource:
+    """Test the capabilities reference resource."""
+
+    def test_capabilities_doc_loaded_from_package_data(self):
+        """Test that the capabilities guide is read from the bundled markdown file."""
+        from travel_assistant.server import combined_travel_server_capabilities
+
+        doc = combined_travel_server_capabilities.fn()
+
+        assert doc.startswith("# Combined Travel Concierge Server")
+        assert doc is combined_travel_server_capabilities.fn()
+
+
+class TestTripBundle:
+    """Test the combined trip bundle search."""
+
+    async def test_bundle_runs_searches_and_isolates_failures(self, monkeypatch):
+        """Test that each search lands under its key and errors stay local."""
+        from travel_assistant import server
+
+        async def fake_flights(**kwargs):
+            return {"best_flights": [kwargs["departure_id"]]}
+
+        async def fake_hotels(**kwargs):
+            raise RuntimeError("boom")
+
+        async def fake_events(**kwargs):
+            return {"events": [kwargs["location"]]}
+
+        monkeypatch.setattr(server.search_flights_serpapi, "fn", fake_flights)
+        monkeypatch.setattr(server.search_hotels_serpapi, "fn", fake_hotels)
+        monkeypatch.setattr(server.search_events_serpapi, "fn", fake_events)
+
+        result = await server.search_trip_bundle.fn(
+            "ZRH", "LIS", "Lisbon", "2026-05-01", ctx=None, return_date="2026-05-05"
+        )
+
+        assert result["flights"] == {"best_flights": ["ZRH"]}
+        assert "boom" in result["hotels"]["error"]
+        assert result["events"] == {"events": ["Lisbon"]}
+
+
+class TestHotelPrefetch:
+    """Test speculative hotel cache warming after flight searches."""
+
+    async def test_prefetch_covers_common_stay_lengths(self, monkeypatch):
+        """Test that a one-way search prefetches each default stay length."""
+        from travel_assistant import server
+
+        fetched = []
+
+        async def fake_run_io(ctx, fn, params):
+            fetched.append(params["check_out_date"])
+
+        monkeypatch.setattr(server, "_run_io", fake_run_io)
+
+        await server._prefetch_hotels(
+            None, "Lisbon", "2026-05-01", None, 1, "EUR", "pt", "en"
+        )
+
+        assert sorted(fetched) == [
+            "2026-05-03",
+            "2026-05-04",
+            "2026-05-06",
+            "2026-05-08",
+        ]
+
+    def test_arrival_city_falls_back_to_airport_code(self):
+        """Test that the arrival city is taken from SerpAPI airport data if present."""
+        from travel_assistant.server import _arrival_city
+
+        data = {"airports": [{"arrival": [{"city": "Lisbon"}]}]}
+
+        assert _arrival_city(data, "LIS") == "Lisbon"
+        assert _arrival_city({}, "LIS") == "LIS"
+
+
+class TestAmadeusFlightValidation:
+    """Test passenger validation in the Amadeus flight search tool."""
+
+    async def test_field_errors_name_the_field(self):
+        """Test that range errors say which passenger count is invalid."""
+        from travel_assistant import server
+
+        result = await server.search_flights_amadeus.fn(
+            "ZRH", "JFK", "2030-01-01", adults=1, ctx=None, children=-1
+        )
+
+        assert result["error"].startswith("children: ")
+
+
+class TestFlightSearchCache:
+    """Test the cached Google Flights fetcher."""
+
+    def _fake_client(self, monkeypatch, responses_):
+        """Route flight fetches through a fake SerpAPI client; return its calls."""
+        from travel_assistant import server
+
+        calls = []
+
+        class FakeClient:
+            def search_flights(self, max_results=None, **params):
+                calls.append((max_results, params))
+                return responses_.pop(0)
+
+        monkeypatch.setattr(server, "_get_serpapi_client", lambda: FakeClient())
+        return calls
+
+    def test_identical_searches_hit_the_cache(self, monkeypatch):
+        """Test that repeats are cached, keyed on max_results, and refreshable."""
+        from travel_assistant import server
+
+        calls = self._fake_client(monkeypatch, [{"best_flights": []}] * 3)
+        params = {"departure_id": "ZRH", "arrival_id": "CDG", "max_results": 3}
+
+        first = server._fetch_serpapi_flights(params)
+        second = server._fetch_serpapi_flights(params)
+        server._fetch_serpapi_flights(params, force_refresh=True)
+
+        assert first is second
+        assert len(calls) == 2
+        assert calls[0] == (3, {"departure_id": "ZRH", "arrival_id": "CDG"})
+
+    def test_errors_are_not_cached(self, monkeypatch):
+        """Test that failed flight searches are retried on the next call."""
+        from travel_assistant import server
+
+        calls = self._fake_client(monkeypatch, [{"error": "boom"}] * 2)
+        params = {"departure_id": "ZRH", "arrival_id": "LHR"}
+
+        server._fetch_serpapi_flights(params)
+        server._fetch_serpapi_flights(params)
+
+        assert len(calls) == 2
+
+
+class TestEventSearch:
+    """Test the Google Events search tool."""
+
+    async def test_date_and_type_filters_are_combined(self, monkeypatch):
+        """Test that date and event type chips are both sent to SerpAPI."""
+        from travel_assistant import server
+
+        sent = {}
+
+        async def fake_run_io(ctx, fn, params, **kwargs):
+            sent.update(params)
+            return {"events_results": []}
+
+        monkeypatch.setattr(server, "_run_io", fake_run_io)
+
+        await server.search_events_serpapi.fn(
+            query="Concerts",
+            ctx=None,
+            location="Bern",
+            date_filter="weekend",
+            event_type="Virtual-Event",
+        )
+
+        assert sent["htichips"] == "date:weekend,event_type:Virtual-Event"
+
+    async def test_events_truncated_without_image_fields(self, monkeypatch):
+        """Test that events are cut to max_results and stripped of image URLs."""
+        from travel_assistant import server
+
+        upstream = {
+            "events_results": [
+                {"title": f"Show {i}", "thumbnail": "t", "image": "i"} for i in range(5)
+            ]
+        }
+
+        async def fake_run_io(ctx, fn, params, **kwargs):
+            return upstream
+
+        monkeypatch.setattr(server, "_run_io", fake_run_io)
+
+        result = await server.search_events_serpapi.fn(
+            query="Shows", ctx=None, max_results=2
+        )
+
+        assert result["events"] == [{"title": "Show 0"}, {"title": "Show 1"}]
+        assert "thumbnail" in upstream["events_results"][0]